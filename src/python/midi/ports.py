@@ -1,8 +1,24 @@
-"""Shared MIDI port detection by name pattern."""
+"""Shared MIDI port detection by name pattern, and timed receive."""
+
+import queue
+import time
 
 import mido
 
 
+def _best_match(names: list[str], patterns: list[str]) -> str | None:
+    """First name matching the highest-priority pattern, in one pass."""
+    best_rank, best = len(patterns), None
+    for name in names:
+        for rank in range(best_rank):
+            if patterns[rank] in name:
+                best_rank, best = rank, name
+                break
+        if best_rank == 0:
+            break
+    return best
+
+
 def find_ports(patterns: list[str]) -> tuple[str | None, str | None]:
     """Find MIDI input/output ports matching any of the given name patterns.
 
@@ -14,16 +30,66 @@ def find_ports(patterns: list[str]) -> tuple[str | None, str | None]:
     Returns:
         Tuple of (input_port_name, output_port_name), either may be None.
     """
-    inputs = mido.get_input_names()
-    outputs = mido.get_output_names()
+    return (_best_match(mido.get_input_names(), patterns),
+            _best_match(mido.get_output_names(), patterns))
+
+
+class QueuedInput:
+    """MIDI input port that supports blocking receive with a timeout.
+
+    mido's blocking receive() has no timeout, so the port is opened with
+    a callback that feeds a queue, and receive() waits on the queue. A
+    reply wakes the caller immediately instead of after a poll interval.
+    Also provides iter_pending() and close() like a mido input port.
+    """
+
+    def __init__(self, name: str):
+        self._queue = queue.SimpleQueue()
+        self._port = mido.open_input(name, callback=self._queue.put)
+
+    @property
+    def closed(self) -> bool:
+        return self._port.closed
 
-    in_port = None
-    out_port = None
+    def close(self):
+        self._port.close()
 
-    for pattern in patterns:
-        if in_port is None:
-            in_port = next((n for n in inputs if pattern in n), None)
-        if out_port is None:
-            out_port = next((n for n in outputs if pattern in n), None)
+    def receive(self, timeout: float | None = None) -> mido.Message | None:
+        """Return the next message, or None if none arrives within timeout."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
 
-    return in_port, out_port
+    def iter_pending(self):
+        """Iterate through already-received messages without waiting."""
+        while True:
+            try:
+                yield self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+
+def receive_message(port_in, timeout: float) -> mido.Message | None:
+    """Wait up to timeout seconds for the next message on an input port.
+
+    Blocks on a QueuedInput; polls any other mido input port every 10 ms.
+
+    Args:
+        port_in: QueuedInput or mido input port.
+        timeout: Maximum wait time in seconds.
+
+    Returns:
+        The next message, or None on timeout.
+    """
+    if isinstance(port_in, QueuedInput):
+        return port_in.receive(timeout=max(0.0, timeout))
+    deadline = time.monotonic() + timeout
+    while True:
+        msg = port_in.poll()
+        if msg is not None:
+            return msg
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(0.01, remaining))
@@ -14,6 +14,8 @@ SDS message format:
 
 import time
 
+from midi.ports import receive_message
+
 # SDS constants
 SDS_SYSEX_ID = 0x7E
 SDS_DUMP_HEADER = 0x01
@@ -24,8 +26,12 @@ SDS_NAK = 0x7E
 SDS_CANCEL = 0x7D
 SDS_WAIT = 0x7C
 
-# Packet data size
+# Packet data size, and full packet size (F0 7E ch 02 nn + data + sum F7)
 SDS_PACKET_DATA_BYTES = 120
+SDS_PACKET_BYTES = SDS_PACKET_DATA_BYTES + 7
+
+# Bit shifts that XOR-fold a data packet's checksummed span onto one byte
+_CHECKSUM_FOLD_SHIFTS = (512, 256, 128, 64, 32, 16, 8)
 
 # Timeouts
 SDS_HANDSHAKE_TIMEOUT = 5.0
@@ -88,36 +94,37 @@ def unpack_sds_to_16bit(sds_data: bytes) -> bytes:
 
 
 def build_data_packet(packet_number: int, sample_data_7bit: bytes,
-                      channel: int = 0x00) -> bytes:
+                      channel: int = 0x00,
+                      into: bytearray | None = None) -> bytes | bytearray:
     """Build an SDS Data Packet message.
 
     Args:
         packet_number: Running counter (0-127, wraps)
         sample_data_7bit: Already 7-bit encoded data (max 120 bytes)
         channel: SDS channel
+        into: Optional SDS_PACKET_BYTES-long bytearray to fill in place
+            and return, so a sender can reuse one buffer for every packet
 
     Returns:
         Complete SDS Data Packet SysEx message (127 bytes)
     """
-    padded = bytearray(sample_data_7bit[:SDS_PACKET_DATA_BYTES])
-    while len(padded) < SDS_PACKET_DATA_BYTES:
-        padded.append(0x00)
-
-    checksum = SDS_SYSEX_ID ^ (channel & 0x7F) ^ SDS_DATA_PACKET ^ (packet_number & 0x7F)
-    for b in padded:
-        checksum ^= b
-
-    msg = bytearray([
-        0xF0,
-        SDS_SYSEX_ID,
-        channel & 0x7F,
-        SDS_DATA_PACKET,
-        packet_number & 0x7F,
-    ])
-    msg.extend(padded)
-    msg.append(checksum & 0x7F)
-    msg.append(0xF7)
-    return bytes(msg)
+    msg = bytearray(SDS_PACKET_BYTES) if into is None else into
+    data = sample_data_7bit[:SDS_PACKET_DATA_BYTES]
+    end = 5 + len(data)
+
+    msg[0:5] = (0xF0, SDS_SYSEX_ID, channel & 0x7F, SDS_DATA_PACKET,
+                packet_number & 0x7F)
+    msg[5:end] = data
+    msg[end:125] = bytes(125 - end)  # zero padding
+
+    # XOR of bytes 1..124: fold the 124 bytes, read as one integer, onto
+    # its low byte by halving shifts (covers up to 128 bytes)
+    checksum = int.from_bytes(msg[1:125], "little")
+    for shift in _CHECKSUM_FOLD_SHIFTS:
+        checksum ^= checksum >> shift
+    msg[125] = checksum & 0x7F
+    msg[126] = 0xF7
+    return bytes(msg) if into is None else msg
 
 
 def parse_handshake(data: bytes) -> dict | None:
@@ -157,19 +164,22 @@ def wait_for_handshake(port_in, timeout: float = SDS_PACKET_TIMEOUT) -> dict | N
     """Wait for an SDS handshake message from the receiver.
 
     Args:
-        port_in: mido input port
+        port_in: QueuedInput or mido input port
         timeout: Maximum wait time in seconds
 
     Returns:
         Parsed handshake dict, or None on timeout
     """
-    start = time.time()
-    while time.time() - start < timeout:
-        for msg in port_in.iter_pending():
-            if msg.type == 'sysex':
-                raw = bytes([0xF0] + list(msg.data) + [0xF7])
-                hs = parse_handshake(raw)
-                if hs:
-                    return hs
-        time.sleep(0.01)
+    deadline = time.monotonic() + timeout
+    remaining = timeout
+    while remaining > 0:
+        msg = receive_message(port_in, remaining)
+        if msg is None:
+            return None
+        if msg.type == 'sysex':
+            raw = b"\xf0" + bytes(msg.data) + b"\xf7"
+            hs = parse_handshake(raw)
+            if hs:
+                return hs
+        remaining = deadline - time.monotonic()
     return None
@@ -51,7 +51,11 @@ def main(argv=None):
     p.add_argument("name", help="Parameter name (e.g. FILFRQ)")
     p.add_argument("header", nargs="?", default="",
                    help="Header type: program, keygroup, or sample")
-    p.set_defaults(func=lambda args: lookup_parameter(args.name, args.header))
+    p.add_argument("--limit", type=int, default=20,
+                   help="Maximum fuzzy matches to show (0 = no limit)")
+    p.set_defaults(func=lambda args: lookup_parameter(
+        args.name, args.header, limit=args.limit,
+    ))
 
     p = sub.add_parser("offset", help="Find parameter at a byte offset")
     p.add_argument("header", help="Header type: program, keygroup, or sample")
@@ -118,8 +122,10 @@ def main(argv=None):
     p.add_argument("value", type=int, help="Value to write")
     p.add_argument("program", type=int, nargs="?", default=0,
                    help="Program number (default: 0)")
+    p.add_argument("--verify", action="store_true",
+                   help="Read the value back from the device to confirm")
     p.set_defaults(func=lambda args: write_program_parameter(
-        args.name, args.value, args.program,
+        args.name, args.value, args.program, verify=args.verify,
     ))
 
     p = sub.add_parser("write-kg", help="Write a keygroup parameter")
@@ -129,8 +135,11 @@ def main(argv=None):
                    help="Program number (default: 0)")
     p.add_argument("keygroup", type=int, nargs="?", default=0,
                    help="Keygroup number (default: 0)")
+    p.add_argument("--verify", action="store_true",
+                   help="Read the value back from the device to confirm")
     p.set_defaults(func=lambda args: write_keygroup_parameter(
         args.name, args.value, args.program, args.keygroup,
+        verify=args.verify,
     ))
 
     p = sub.add_parser("summary", help="Full program settings summary")
@@ -21,6 +21,7 @@ from s2800.agent.tools import (
     create_program,
     decode_sysex_message,
     describe_agent,
+    invalidate_device_cache,
     list_parameters,
     load_preset,
     lookup_by_offset,
@@ -34,6 +35,7 @@ from s2800.agent.tools import (
     save_preset,
     write_keygroup_parameter,
     write_program_parameter,
+    write_program_parameters,
 )
 
 # Load the full specification text
@@ -59,7 +61,7 @@ structured data.
 
 ## Tool Usage
 
-- `lookup_parameter(name, header_type)` -- find a parameter by name
+- `lookup_parameter(name, header_type, limit)` -- find a parameter by name (exact match first, then up to `limit` fuzzy matches)
 - `lookup_by_offset(header_type, offset)` -- reverse lookup by byte offset
 - `list_parameters(header_type, filter_text)` -- list/filter parameters
 - `build_sysex_message(operation, channel, item_index, selector, offset, length, data_bytes)` -- construct a SysEx message
@@ -73,8 +75,10 @@ structured data.
 - `read_program_parameter(parameter_name, program_number)` -- read a single parameter's current value
 - `read_keygroup_parameter(parameter_name, program_number, keygroup_number)` -- read a keygroup parameter's current value
 - `read_program_summary(program_number)` -- read a summary of key program settings
-- `write_program_parameter(parameter_name, value, program_number)` -- write a program parameter
-- `write_keygroup_parameter(parameter_name, value, program_number, keygroup_number)` -- write a keygroup parameter
+- `write_program_parameter(parameter_name, value, program_number, verify)` -- write a program parameter
+- `write_program_parameters(parameters_json, program_number, verify)` -- write several program parameters in one batch; parameters_json is a JSON object string like '{{"POLYPH":15,"PRLOUD":90}}'
+- `write_keygroup_parameter(parameter_name, value, program_number, keygroup_number, verify)` -- write a keygroup parameter
+- `invalidate_device_cache()` -- discard header reads cached for the last half second (use after front-panel edits)
 - `create_program(name, keygroups_json, midi_channel, program_number)` -- create a new program with keygroup assignments; keygroups_json is a JSON array string like '[{{"low_note":36,"high_note":36,"sample_name":"KICK"}},...] '; program_number=-1 appends after existing programs
 
 ### Preset Tools (save/restore program configurations)
@@ -82,8 +86,10 @@ structured data.
 - `save_preset(directory, program_number)` -- save a program to a preset JSON file
 - `load_preset(directory, slot)` -- restore a preset from JSON to the device
 
-The write tools read the current value first, write the new value, then read \
-back to confirm the change took effect. They show before/after values.
+The write tools read the current value first, then write the new value and \
+show before/after values. Pass verify=True to read the header back from the \
+device and confirm the change took effect. The batch tool skips the reads by \
+default and reads once before and after when verify=True.
 
 When a user asks about their current device state, USE the live device tools \
 to read actual values. Then combine what you read with your spec knowledge to \
@@ -118,7 +124,9 @@ polyphony is 0 (1 voice), explain that and show the SysEx message to change it.
         read_keygroup_parameter,
         read_program_summary,
         write_program_parameter,
+        write_program_parameters,
         write_keygroup_parameter,
+        invalidate_device_cache,
         create_program,
         save_preset,
         load_preset,
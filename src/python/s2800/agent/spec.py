@@ -7,6 +7,7 @@ layer that agent tools query against.
 Reference: https://lakai.sourceforge.net/docs/s2800_sysex.html
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 
@@ -20,6 +21,41 @@ class Parameter:
     description: str
     models: list[str] = field(default_factory=lambda: ["S2800", "S3000", "S3200"])
     notes: str = ""
+    # Lowercased name/description, cached for case-insensitive searches
+    _name_lc: str = field(init=False, repr=False, compare=False)
+    _desc_lc: str = field(init=False, repr=False, compare=False)
+    # Raw value -> display string, classified once from range_desc
+    _interpret: Callable[[int], str] = field(init=False, repr=False,
+                                             compare=False)
+    # Whether range_desc describes a signed ("-50 to +50") value
+    _signed: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._name_lc = self.name.lower()
+        self._desc_lc = self.description.lower()
+        lowered = self.range_desc.lower()
+        parts = tuple(part.strip() for part in self.range_desc.split(","))
+        self._interpret = _build_interpreter(lowered, parts)
+        self._signed = _is_signed_range(lowered)
+
+    @property
+    def name_lc(self) -> str:
+        """Lowercased name, for case-insensitive searches."""
+        return self._name_lc
+
+    @property
+    def desc_lc(self) -> str:
+        """Lowercased description, for case-insensitive searches."""
+        return self._desc_lc
+
+    @property
+    def signed(self) -> bool:
+        """Whether the raw bytes hold a two's complement value."""
+        return self._signed
+
+    def interpret(self, raw: int) -> str:
+        """Format a raw value for display according to range_desc."""
+        return self._interpret(raw)
 
 
 @dataclass
@@ -30,6 +66,40 @@ class HeaderSpec:
     request_opcode: int
     response_opcode: int
     parameters: list[Parameter] = field(default_factory=list)
+    # Parameter name -> Parameter, for direct lookups by exact name
+    _by_name: dict[str, Parameter] = field(init=False, repr=False,
+                                           compare=False)
+    # Start offset -> first Parameter starting there
+    _by_offset: dict[int, Parameter] = field(init=False, repr=False,
+                                             compare=False)
+    # Byte offset -> first Parameter whose span covers it (None if unused)
+    _covering: list[Parameter | None] = field(init=False, repr=False,
+                                              compare=False)
+
+    def __post_init__(self):
+        self._by_name = {p.name: p for p in self.parameters}
+        self._by_offset = {}
+        self._covering = [None] * self.total_size
+        for p in self.parameters:
+            self._by_offset.setdefault(p.offset, p)
+            for b in range(p.offset, min(p.offset + p.size, self.total_size)):
+                if self._covering[b] is None:
+                    self._covering[b] = p
+
+    def param_named(self, name: str) -> Parameter | None:
+        """Return the parameter with this exact name, or None."""
+        return self._by_name.get(name)
+
+    def param_at(self, offset: int) -> Parameter | None:
+        """Return the parameter at a byte offset, or None if unused.
+
+        Prefers the first parameter starting at offset; otherwise returns
+        the first one whose span covers it.
+        """
+        param = self._by_offset.get(offset)
+        if param is None and 0 <= offset < self.total_size:
+            param = self._covering[offset]
+        return param
 
 
 @dataclass
@@ -59,6 +129,56 @@ class MiscDataType:
     description: str
 
 
+def _is_signed_range(lowered: str) -> bool:
+    """Whether a lowercased range description is a signed span."""
+    return "to" in lowered and "-" in lowered
+
+
+def _build_interpreter(lowered: str,
+                       parts: tuple[str, ...]) -> Callable[[int], str]:
+    """Classify a range description into a raw-value formatter.
+
+    Takes the lowercased range description and its stripped
+    comma-separated parts. Enum labels like "0=OFF, 1=ON" are looked up
+    first; values without a label fall through to the signed
+    ("-50 to +50"), voice count ("represents 1-32 voices"), mod source,
+    or plain integer formatter.
+    """
+    labels: dict[int, str] = {}
+    if "=" in lowered:
+        for part in parts:
+            if "=" in part:
+                val_str, label = part.split("=", 1)
+                try:
+                    labels.setdefault(int(val_str.strip()), label.strip())
+                except ValueError:
+                    pass
+
+    if _is_signed_range(lowered):
+        def fallback(raw: int) -> str:
+            return str(raw - 256 if raw > 127 else raw)
+    elif "represents" in lowered and "voices" in lowered:
+        def fallback(raw: int) -> str:
+            return f"{raw} (= {raw + 1} voices)"
+    elif "mod source" in lowered:
+        def fallback(raw: int) -> str:
+            name = _MOD_SOURCE_NAMES.get(raw)
+            return str(raw) if name is None else f"{raw} ({name})"
+    else:
+        fallback = str
+
+    if not labels:
+        return fallback
+
+    def interpret(raw: int) -> str:
+        label = labels.get(raw)
+        if label is None:
+            return fallback(raw)
+        return f"{raw} ({label})"
+
+    return interpret
+
+
 # ---------------------------------------------------------------------------
 # Modulation Sources
 # ---------------------------------------------------------------------------
@@ -81,6 +201,8 @@ MODULATION_SOURCES = [
     ModulationSource(14, "Env3", "Auxiliary envelope (envelope 3) output"),
 ]
 
+_MOD_SOURCE_NAMES: dict[int, str] = {src.value: src.name for src in MODULATION_SOURCES}
+
 # ---------------------------------------------------------------------------
 # Operation Codes
 # ---------------------------------------------------------------------------
@@ -823,6 +945,16 @@ ALL_HEADERS: dict[str, HeaderSpec] = {
     "sample": SAMPLE_HEADER,
 }
 
+# Short names accepted wherever a header type is given (keys lowercase)
+HEADER_ALIASES: dict[str, str] = {
+    "prog": "program",
+    "pgm": "program",
+    "kg": "keygroup",
+    "kgrp": "keygroup",
+    "sam": "sample",
+    "smp": "sample",
+}
+
 # ---------------------------------------------------------------------------
 # Model Differences Summary
 # ---------------------------------------------------------------------------
@@ -6,28 +6,46 @@ message construction and parsing, and reading live values from a
 connected S2800 sampler over MIDI.
 """
 
-import inspect
+import functools
 import json
 import logging
+import mmap
+import re
+import struct
+import time
+import types
+import wave
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
+
 from s2800.agent.spec import (
     ALL_HEADERS,
-    MODULATION_SOURCES,
+    HEADER_ALIASES,
     MODEL_DIFFERENCES,
     OPCODES,
     HeaderSpec,
     Parameter,
 )
 from s2800.protocol import (
+    FUNC_S3K_KDATA,
+    FUNC_S3K_PDATA,
     build_message,
     decode_akai_name,
+    encode_akai_name,
     nibble_decode,
     nibble_encode,
 )
 
 from s2800.connection import SamplerConnection, get_sampler as _get_sampler_impl
-from s2800.connection import write_raw_bytes as _write_raw_bytes_impl
+from s2800.connection import reset_sampler as _reset_sampler_impl
+from s2800.connection import read_keygroups as _read_keygroups_impl
+from s2800.connection import read_sample_headers as _read_sample_headers_impl
+from s2800.connection import WRITE_UNCONFIRMED
+from s2800.connection import write_raw_bytes as _write_raw_bytes
+from s2800.connection import read_header_cached as _read_header_cached
+from s2800.connection import invalidate_header_cache as _invalidate_header_cache
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +57,48 @@ _AGENT_DESCRIPTION = (
     "and read/write live device state over MIDI."
 )
 
+# Formatted describe_agent() output, built on first call
+_describe_cache: str | None = None
+
+
+def _format_annotation(annotation) -> str:
+    """Render an annotation the way inspect.signature does."""
+    if isinstance(annotation, type):
+        if annotation.__module__ == "builtins":
+            return annotation.__qualname__
+        return f"{annotation.__module__}.{annotation.__qualname__}"
+    return repr(annotation).replace("typing.", "")
+
+
+def _signature_text(fn) -> str:
+    """Format a function signature from its code object.
+
+    Produces the same text as str(inspect.signature(fn)) for the plain
+    positional-or-keyword tool functions in this module, without the
+    cost of building Signature/Parameter objects.
+    """
+    code = fn.__code__
+    names = code.co_varnames[:code.co_argcount]
+    defaults = fn.__defaults__ or ()
+    first_default = len(names) - len(defaults)
+    annotations = fn.__annotations__
+
+    parts = []
+    for i, name in enumerate(names):
+        part = name
+        equals = "="
+        if name in annotations:
+            part += f": {_format_annotation(annotations[name])}"
+            equals = " = "
+        if i >= first_default:
+            part += f"{equals}{defaults[i - first_default]!r}"
+        parts.append(part)
+
+    text = f"({', '.join(parts)})"
+    if "return" in annotations:
+        text += f" -> {_format_annotation(annotations['return'])}"
+    return text
+
 
 def describe_agent() -> str:
     """Describe this agent's capabilities and available tools.
@@ -51,18 +111,20 @@ def describe_agent() -> str:
     Returns:
         Formatted description of the agent and its tools.
     """
-    module = inspect.getmodule(describe_agent)
+    global _describe_cache
+    if _describe_cache is not None:
+        return _describe_cache
+
     tools = []
-    for name, obj in inspect.getmembers(module, inspect.isfunction):
-        if name.startswith("_"):
+    for name, obj in list(globals().items()):
+        if name.startswith("_") or not isinstance(obj, types.FunctionType):
             continue
         # Only include functions defined in this module
-        if inspect.getmodule(obj) is not module:
+        if obj.__module__ != __name__:
             continue
-        sig = inspect.signature(obj)
         doc = obj.__doc__ or ""
         summary = doc.strip().split("\n")[0] if doc else "(no description)"
-        tools.append((name, str(sig), summary))
+        tools.append((name, _signature_text(obj), summary))
 
     lines = [
         f"Agent: {_AGENT_NAME}",
@@ -75,80 +137,153 @@ def describe_agent() -> str:
         lines.append(f"    {summary}")
         lines.append("")
 
-    return "\n".join(lines)
+    _describe_cache = "\n".join(lines)
+    return _describe_cache
+
+
+# Default Parameter.models value: available on every model
+_ALL_MODELS = ["S2800", "S3000", "S3200"]
+
+
+def _build_name_index() -> dict[str, Parameter]:
+    """Index every parameter by exact name across all headers."""
+    index: dict[str, Parameter] = {}
+    for hdr in ALL_HEADERS.values():
+        for param in hdr.parameters:
+            if param.name in index:
+                raise ValueError(f"Duplicate parameter name {param.name!r}")
+            index[param.name] = param
+    return index
+
+
+# Parameter name -> Parameter across all headers (names are unique)
+_PARAMS_BY_NAME = _build_name_index()
 
 
 def _format_parameter(param: Parameter, header_name: str = "") -> str:
     """Format a single parameter for display."""
-    lines = []
     prefix = f"[{header_name}] " if header_name else ""
-    lines.append(f"{prefix}{param.name}")
-    lines.append(f"  Offset: {param.offset} (0x{param.offset:02X})")
-    lines.append(f"  Size: {param.size} byte(s)")
-    lines.append(f"  Range: {param.range_desc}")
-    lines.append(f"  Description: {param.description}")
-    if param.models != ["S2800", "S3000", "S3200"]:
-        lines.append(f"  Models: {', '.join(param.models)}")
-    if param.notes:
-        lines.append(f"  Notes: {param.notes}")
-    return "\n".join(lines)
+    models = (f"\n  Models: {', '.join(param.models)}"
+              if param.models != _ALL_MODELS else "")
+    notes = f"\n  Notes: {param.notes}" if param.notes else ""
+    return (f"{prefix}{param.name}\n"
+            f"  Offset: {param.offset} (0x{param.offset:02X})\n"
+            f"  Size: {param.size} byte(s)\n"
+            f"  Range: {param.range_desc}\n"
+            f"  Description: {param.description}"
+            f"{models}{notes}")
+
+
+def _hex_0x(data: bytes) -> str:
+    """Render bytes as space-separated 0xNN tokens."""
+    if not data:
+        return ""
+    return "0x" + data.hex(" ").upper().replace(" ", " 0x")
+
+
+def _fuzzy_matcher(query: str) -> Callable[[str], bool]:
+    """Build a partial-match test for a lowercased query.
+
+    A single-token query is a plain substring test. A multi-token query
+    ("filter freq") matches text containing every token in any order,
+    using one precompiled lookahead regex per search, after a length
+    check against the longest token.
+
+    Candidate text must already be lowercased. Parameter provides its
+    lowercased name and description as name_lc and desc_lc.
+    """
+    tokens = query.split()
+    if len(tokens) <= 1:
+        needle = tokens[0] if tokens else ""
+        return lambda text: needle in text
+    pattern = re.compile(
+        "".join(f"(?=.*{re.escape(token)})" for token in tokens), re.DOTALL
+    )
+    # Text shorter than the longest token cannot match; skip the regex
+    min_len = max(map(len, tokens))
+    return lambda text: len(text) >= min_len and pattern.match(text) is not None
 
 
-def _fuzzy_match(query: str, name: str) -> bool:
-    """Check if query matches a parameter name (case-insensitive, partial)."""
-    return query.lower() in name.lower()
+# Valid header type names, for error messages
+_HEADER_TYPES = ", ".join(ALL_HEADERS)
 
 
 def _find_header(header_type: str) -> HeaderSpec | None:
-    """Find a header spec by type name."""
+    """Find a header spec by type name or short alias ("kg", "pgm")."""
     key = header_type.lower().strip()
-    return ALL_HEADERS.get(key)
+    return ALL_HEADERS.get(HEADER_ALIASES.get(key, key))
+
+
+def _build_exact_index() -> dict[str, list[tuple[str, Parameter]]]:
+    """Index every parameter by lowercased name across all headers."""
+    index: dict[str, list[tuple[str, Parameter]]] = {}
+    for hdr_name, hdr in ALL_HEADERS.items():
+        for param in hdr.parameters:
+            index.setdefault(param.name_lc, []).append((hdr_name, param))
+    return index
+
+
+# Lowercased parameter name -> [(header name, Parameter), ...]
+_EXACT_PARAMS = _build_exact_index()
 
 
-def lookup_parameter(name: str, header_type: str = "") -> str:
+def lookup_parameter(name: str, header_type: str = "", limit: int = 20) -> str:
     """Look up a parameter by name (exact or fuzzy match).
 
     Returns offset, size, range, description, and model support.
-    If header_type is empty, searches all headers.
+    If header_type is empty, searches all headers. An exact name match
+    is returned on its own; otherwise partial matches on name or
+    description are listed.
 
     Args:
         name: Parameter name to search for (e.g. "FILFRQ", "filter freq").
         header_type: Optional header type to restrict search ("program",
             "keygroup", or "sample"). If empty, searches all headers.
+        limit: Maximum number of fuzzy matches to return (0 = no limit).
 
     Returns:
         Formatted string with parameter details, or an error message if
         no match is found.
     """
-    results = []
     headers_to_search = {}
 
     if header_type:
         header = _find_header(header_type)
         if not header:
             return (f"Unknown header type: '{header_type}'. "
-                    f"Valid types: {', '.join(ALL_HEADERS.keys())}")
+                    f"Valid types: {_HEADER_TYPES}")
         headers_to_search = {header.name: header}
     else:
         headers_to_search = ALL_HEADERS
 
-    query = name.strip()
+    query = name.strip().lower()
 
-    for hdr_name, hdr in headers_to_search.items():
-        for param in hdr.parameters:
-            # Exact match (case-insensitive)
-            if param.name.lower() == query.lower():
-                results.insert(0, _format_parameter(param, hdr_name))
-            # Fuzzy match on name or description
-            elif (_fuzzy_match(query, param.name)
-                  or _fuzzy_match(query, param.description)):
-                results.append(_format_parameter(param, hdr_name))
+    # Exact match (case-insensitive) skips the fuzzy scan entirely
+    results = [
+        _format_parameter(param, hdr_name)
+        for hdr_name, param in _EXACT_PARAMS.get(query, ())
+        if hdr_name in headers_to_search
+    ]
+
+    # Fuzzy match on name or description; matches past the limit are
+    # counted but not formatted
+    total = len(results)
+    if not results:
+        matches = _fuzzy_matcher(query)
+        for hdr_name, hdr in headers_to_search.items():
+            for param in hdr.parameters:
+                if matches(param.name_lc) or matches(param.desc_lc):
+                    total += 1
+                    if not limit or len(results) < limit:
+                        results.append(_format_parameter(param, hdr_name))
 
     if not results:
         return f"No parameter found matching '{name}'."
 
     header_info = f" (in {header_type} header)" if header_type else ""
-    return (f"Found {len(results)} match(es){header_info}:\n\n"
+    more = (f" (showing {len(results)} of {total}; refine the query or "
+            f"raise limit)" if total > len(results) else "")
+    return (f"Found {total} match(es){header_info}{more}:\n\n"
             + "\n\n".join(results))
 
 
@@ -166,28 +301,38 @@ def lookup_by_offset(header_type: str, offset: int) -> str:
     header = _find_header(header_type)
     if not header:
         return (f"Unknown header type: '{header_type}'. "
-                f"Valid types: {', '.join(ALL_HEADERS.keys())}")
+                f"Valid types: {_HEADER_TYPES}")
 
     if offset < 0 or offset >= header.total_size:
         return (f"Offset {offset} is out of range for {header_type} header "
                 f"(valid: 0-{header.total_size - 1}).")
 
-    # Find exact offset match
-    for param in header.parameters:
-        if param.offset == offset:
-            return _format_parameter(param, header.name)
+    # Exact offset match, else the parameter that spans this offset
+    param = header.param_at(offset)
+    if param is not None and param.offset == offset:
+        return _format_parameter(param, header.name)
 
-    # Find parameter that spans this offset
-    for param in header.parameters:
-        if param.offset <= offset < param.offset + param.size:
-            byte_within = offset - param.offset
-            return (f"Offset {offset} is byte {byte_within} within:\n\n"
-                    + _format_parameter(param, header.name))
+    if param is not None:
+        byte_within = offset - param.offset
+        return (f"Offset {offset} is byte {byte_within} within:\n\n"
+                + _format_parameter(param, header.name))
 
     return (f"No parameter defined at offset {offset} in {header_type} header. "
             f"This offset may be in a reserved/unused region.")
 
 
+# Column header and row layout for list_parameters
+_TABLE_HEADER = (f"{'Name':<14} {'Offset':>6} {'Size':>4}  {'Range':<30} Description\n"
+                 + "-" * 90)
+_ROW_FMT = "{:<14} {:>6} {:>4}  {:<30} {}{}".format
+
+
+def _table_row(p: Parameter) -> str:
+    """One list_parameters table row for a parameter."""
+    return _ROW_FMT(p.name, p.offset, p.size, p.range_desc, p.description,
+                    "" if p.models == _ALL_MODELS else f" [{','.join(p.models)}]")
+
+
 def list_parameters(header_type: str, filter_text: str = "") -> str:
     """List all parameters for a header type, optionally filtered.
 
@@ -202,14 +347,14 @@ def list_parameters(header_type: str, filter_text: str = "") -> str:
     header = _find_header(header_type)
     if not header:
         return (f"Unknown header type: '{header_type}'. "
-                f"Valid types: {', '.join(ALL_HEADERS.keys())}")
+                f"Valid types: {_HEADER_TYPES}")
 
     params = header.parameters
     if filter_text:
-        query = filter_text.lower()
+        matches = _fuzzy_matcher(filter_text.lower())
         params = [
             p for p in params
-            if query in p.name.lower() or query in p.description.lower()
+            if matches(p.name_lc) or matches(p.desc_lc)
         ]
 
     if not params:
@@ -217,26 +362,16 @@ def list_parameters(header_type: str, filter_text: str = "") -> str:
                 + (f" matching '{filter_text}'" if filter_text else "")
                 + ".")
 
-    lines = [
-        f"{header_type.upper()} HEADER ({header.total_size} bytes, "
-        f"request: 0x{header.request_opcode:02X}, "
-        f"response: 0x{header.response_opcode:02X})",
-        "",
-        f"{'Name':<14} {'Offset':>6} {'Size':>4}  {'Range':<30} Description",
-        "-" * 90,
-    ]
+    title = (f"{header_type.upper()} HEADER ({header.total_size} bytes, "
+             f"request: 0x{header.request_opcode:02X}, "
+             f"response: 0x{header.response_opcode:02X})")
+    rows = "\n".join(_table_row(p) for p in params)
+    return (f"{title}\n\n{_TABLE_HEADER}\n{rows}\n"
+            f"\nTotal: {len(params)} parameter(s)")
 
-    for p in params:
-        models_note = ""
-        if p.models != ["S2800", "S3000", "S3200"]:
-            models_note = f" [{','.join(p.models)}]"
-        lines.append(
-            f"{p.name:<14} {p.offset:>6} {p.size:>4}  "
-            f"{p.range_desc:<30} {p.description}{models_note}"
-        )
 
-    lines.append(f"\nTotal: {len(params)} parameter(s)")
-    return "\n".join(lines)
+# Item/selector/offset/length bytes following the 5-byte SysEx header
+_REQUEST_FIELDS = struct.Struct("7B")
 
 
 def build_sysex_message(
@@ -288,16 +423,20 @@ def build_sysex_message(
     len_lo = length & 0x7F
     len_hi = (length >> 7) & 0x7F
 
-    payload = bytes([idx_lo, idx_hi, sel, off_lo, off_hi, len_lo, len_hi])
-
-    # Append nibble-encoded data if provided
+    # Nibble-encode data if provided (converted and encoded once, reused below)
+    raw_data = encoded = b""
     if data_bytes is not None:
         raw_data = bytes(data_bytes)
         encoded = nibble_encode(raw_data)
-        payload = payload + encoded
+
+    # Single allocation: 7 header bytes followed by the encoded data
+    payload = bytearray(_REQUEST_FIELDS.size + len(encoded))
+    _REQUEST_FIELDS.pack_into(payload, 0, idx_lo, idx_hi, sel,
+                              off_lo, off_hi, len_lo, len_hi)
+    payload[_REQUEST_FIELDS.size:] = encoded
 
     msg = build_message(channel, opcode, payload)
-    hex_str = " ".join(f"{b:02X}" for b in msg)
+    hex_str = msg.hex(" ").upper()
 
     # Build explanation
     op_info = _get_opcode_info(opcode)
@@ -318,8 +457,8 @@ def build_sysex_message(
     ]
 
     if data_bytes is not None:
-        data_hex = " ".join(f"{b:02X}" for b in data_bytes)
-        encoded_hex = " ".join(f"{b:02X}" for b in nibble_encode(bytes(data_bytes)))
+        data_hex = raw_data.hex(" ").upper()
+        encoded_hex = encoded.hex(" ").upper()
         explanation.append(f"    {encoded_hex} - Data (nibble-encoded): [{data_hex}]")
 
     explanation.append(f"    F7          - SysEx end")
@@ -327,6 +466,13 @@ def build_sysex_message(
     return "\n".join(explanation)
 
 
+# Separator characters stripped from decode_sysex_message input
+_HEX_SEPARATORS = str.maketrans("", "", " ,\t\r\n")
+
+# Fixed 12-byte S3000 message prefix: F0 47 cc op 48 ii II ss oo OO nn NN
+_SYSEX_PREFIX = struct.Struct("12B")
+
+
 def decode_sysex_message(hex_string: str) -> str:
     """Parse a raw SysEx hex string into human-readable form.
 
@@ -343,7 +489,7 @@ def decode_sysex_message(hex_string: str) -> str:
         Human-readable breakdown of the message.
     """
     # Parse hex string to bytes
-    cleaned = hex_string.replace(" ", "").replace(",", "").replace("0x", "")
+    cleaned = hex_string.translate(_HEX_SEPARATORS).lower().replace("0x", "")
     if len(cleaned) % 2 != 0:
         return f"Invalid hex string: odd number of characters ({len(cleaned)})"
 
@@ -356,27 +502,23 @@ def decode_sysex_message(hex_string: str) -> str:
         return (f"Message too short ({len(msg_bytes)} bytes). "
                 f"Minimum S3000 SysEx message is 12 bytes (header only, no data).")
 
+    (start, manufacturer, channel, opcode, model,
+     item_lo, item_hi, selector,
+     offset_lo, offset_hi,
+     length_lo, length_hi) = _SYSEX_PREFIX.unpack_from(msg_bytes)
+
     # Validate structure
-    if msg_bytes[0] != 0xF0:
-        return f"Not a SysEx message: first byte is 0x{msg_bytes[0]:02X}, expected 0xF0"
+    if start != 0xF0:
+        return f"Not a SysEx message: first byte is 0x{start:02X}, expected 0xF0"
     if msg_bytes[-1] != 0xF7:
         return f"Missing SysEx end marker: last byte is 0x{msg_bytes[-1]:02X}, expected 0xF7"
-    if msg_bytes[1] != 0x47:
-        return f"Not an Akai message: manufacturer 0x{msg_bytes[1]:02X}, expected 0x47"
-    if msg_bytes[4] != 0x48:
-        return f"Not S1000/S3000 family: model 0x{msg_bytes[4]:02X}, expected 0x48"
-
-    channel = msg_bytes[2]
-    opcode = msg_bytes[3]
-    item_lo = msg_bytes[5]
-    item_hi = msg_bytes[6]
+    if manufacturer != 0x47:
+        return f"Not an Akai message: manufacturer 0x{manufacturer:02X}, expected 0x47"
+    if model != 0x48:
+        return f"Not S1000/S3000 family: model 0x{model:02X}, expected 0x48"
+
     item_index = item_lo | (item_hi << 7)
-    selector = msg_bytes[7]
-    offset_lo = msg_bytes[8]
-    offset_hi = msg_bytes[9]
     offset = offset_lo | (offset_hi << 7)
-    length_lo = msg_bytes[10]
-    length_hi = msg_bytes[11]
     length = length_lo | (length_hi << 7)
 
     # Check post-change flags in item index
@@ -408,7 +550,7 @@ def decode_sysex_message(hex_string: str) -> str:
     data_portion = msg_bytes[12:-1]
     if data_portion:
         decoded = nibble_decode(data_portion)
-        decoded_hex = " ".join(f"0x{b:02X}" for b in decoded)
+        decoded_hex = _hex_0x(decoded)
         lines.append(f"  Data ({len(decoded)} bytes): [{decoded_hex}]")
 
         # Try to decode as Akai name if it looks like name data
@@ -428,8 +570,7 @@ def decode_sysex_message(hex_string: str) -> str:
         param_info = lookup_by_offset(header_type, offset)
         if "No parameter" not in param_info:
             lines.append(f"\n  Parameter at offset {offset}:")
-            for line in param_info.split("\n"):
-                lines.append(f"    {line}")
+            lines.append("    " + param_info.replace("\n", "\n    "))
 
     return "\n".join(lines)
 
@@ -459,11 +600,12 @@ def compare_models(parameter_name: str = "") -> str:
     # Look up the specific parameter across all headers
     results = []
     query = parameter_name.strip().lower()
+    matches = _fuzzy_matcher(query)
 
     for hdr_name, hdr in ALL_HEADERS.items():
         for param in hdr.parameters:
-            if (param.name.lower() == query
-                    or _fuzzy_match(query, param.name)):
+            if (param.name_lc == query
+                    or matches(param.name_lc)):
                 results.append((hdr_name, param))
 
     if not results:
@@ -475,9 +617,9 @@ def compare_models(parameter_name: str = "") -> str:
         lines.append(_format_parameter(param, hdr_name))
         lines.append("")
 
-        if param.models != ["S2800", "S3000", "S3200"]:
+        if param.models != _ALL_MODELS:
             lines.append(f"  Availability: {', '.join(param.models)} only")
-            missing = [m for m in ["S2800", "S3000", "S3200"]
+            missing = [m for m in _ALL_MODELS
                        if m not in param.models]
             if missing:
                 lines.append(f"  Not available on: {', '.join(missing)}")
@@ -495,6 +637,45 @@ def compare_models(parameter_name: str = "") -> str:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Common operation names accepted by _resolve_opcode. Keys use underscores;
+# spaces and hyphens in the requested name are folded to underscores first.
+_OPCODE_NAMES: dict[str, int] = {
+    "request_program": 0x27,
+    "req_program": 0x27,
+    "program_header": 0x28,
+    "send_program": 0x28,
+    "request_keygroup": 0x29,
+    "req_keygroup": 0x29,
+    "keygroup_header": 0x2A,
+    "send_keygroup": 0x2A,
+    "request_sample": 0x2B,
+    "req_sample": 0x2B,
+    "sample_header": 0x2C,
+    "send_sample": 0x2C,
+    "request_fx": 0x2D,
+    "request_reverb": 0x2D,
+    "fx_data": 0x2E,
+    "reverb_data": 0x2E,
+    "request_cuelist": 0x2F,
+    "request_cue_list": 0x2F,
+    "cuelist_data": 0x30,
+    "request_takelist": 0x31,
+    "request_take_list": 0x31,
+    "takelist_data": 0x32,
+    "request_misc": 0x33,
+    "request_miscellaneous": 0x33,
+    "misc_data": 0x34,
+    "request_volume": 0x35,
+    "request_volume_list": 0x35,
+    "volume_data": 0x36,
+    "request_hd": 0x37,
+    "request_harddisk": 0x37,
+    "request_hd_directory": 0x37,
+    "hd_data": 0x38,
+}
+_OPCODE_NAME_FOLD = str.maketrans(" -", "__")
+
+
 def _resolve_opcode(operation: str) -> int | None:
     """Resolve an operation string to a numeric opcode."""
     # Try direct hex
@@ -511,114 +692,68 @@ def _resolve_opcode(operation: str) -> int | None:
     except ValueError:
         pass
 
-    # Map common names to opcodes
-    name_map = {
-        "request_program": 0x27,
-        "request program": 0x27,
-        "req_program": 0x27,
-        "program_header": 0x28,
-        "program header": 0x28,
-        "send_program": 0x28,
-        "request_keygroup": 0x29,
-        "request keygroup": 0x29,
-        "req_keygroup": 0x29,
-        "keygroup_header": 0x2A,
-        "keygroup header": 0x2A,
-        "send_keygroup": 0x2A,
-        "request_sample": 0x2B,
-        "request sample": 0x2B,
-        "req_sample": 0x2B,
-        "sample_header": 0x2C,
-        "sample header": 0x2C,
-        "send_sample": 0x2C,
-        "request_fx": 0x2D,
-        "request fx": 0x2D,
-        "request_reverb": 0x2D,
-        "fx_data": 0x2E,
-        "reverb_data": 0x2E,
-        "request_cuelist": 0x2F,
-        "request cue list": 0x2F,
-        "cuelist_data": 0x30,
-        "request_takelist": 0x31,
-        "request take list": 0x31,
-        "takelist_data": 0x32,
-        "request_misc": 0x33,
-        "request miscellaneous": 0x33,
-        "misc_data": 0x34,
-        "request_volume": 0x35,
-        "request volume list": 0x35,
-        "volume_data": 0x36,
-        "request_hd": 0x37,
-        "request harddisk": 0x37,
-        "request hd directory": 0x37,
-        "hd_data": 0x38,
-    }
-
-    return name_map.get(op)
+    return _OPCODE_NAMES.get(op.translate(_OPCODE_NAME_FOLD))
+
+
+# Opcode -> "Name (direction)" description
+_OPCODE_INFO: dict[int, str] = {
+    op.code: f"{op.name} ({op.direction})" for op in OPCODES
+}
+
+# Opcode -> header type it operates on
+_OPCODE_HEADER_TYPES: dict[int, str] = {
+    0x27: "program",
+    0x28: "program",
+    0x29: "keygroup",
+    0x2A: "keygroup",
+    0x2B: "sample",
+    0x2C: "sample",
+}
 
 
 def _get_opcode_info(opcode: int) -> str:
     """Get a human-readable description for an opcode."""
-    for op in OPCODES:
-        if op.code == opcode:
-            return f"{op.name} ({op.direction})"
-    return f"Unknown opcode 0x{opcode:02X}"
+    info = _OPCODE_INFO.get(opcode)
+    if info is None:
+        return f"Unknown opcode 0x{opcode:02X}"
+    return info
 
 
 def _opcode_to_header_type(opcode: int) -> str | None:
     """Map an opcode to the header type it operates on."""
-    mapping = {
-        0x27: "program",
-        0x28: "program",
-        0x29: "keygroup",
-        0x2A: "keygroup",
-        0x2B: "sample",
-        0x2C: "sample",
-    }
-    return mapping.get(opcode)
+    return _OPCODE_HEADER_TYPES.get(opcode)
 
 
 # ---------------------------------------------------------------------------
 # Live device tools
 # ---------------------------------------------------------------------------
 
-def _interpret_value(param: Parameter, raw_value: int) -> str:
-    """Interpret a raw byte value using the parameter's range description."""
-    range_desc = param.range_desc.lower()
-
-    # Boolean/enum style: "0=OFF, 1=ON"
-    if "=" in param.range_desc:
-        for part in param.range_desc.split(","):
-            part = part.strip()
-            if "=" in part:
-                val_str, label = part.split("=", 1)
-                try:
-                    if int(val_str.strip()) == raw_value:
-                        return f"{raw_value} ({label.strip()})"
-                except ValueError:
-                    pass
-
-    # Signed range like "-50 to +50"
-    if "to" in range_desc and "-" in range_desc:
-        if raw_value > 127:
-            signed = raw_value - 256
-        elif raw_value > 50 and "+50" in range_desc:
-            signed = raw_value - 256 if raw_value > 127 else raw_value
-        else:
-            signed = raw_value
-        return str(signed)
+@functools.lru_cache(maxsize=512)
+def _match_params(header_name: str, query: str) -> tuple[Parameter, ...]:
+    """Parameters in a header matching a lowercased query.
 
-    # "represents 1-32 voices" style
-    if "represents" in range_desc and "voices" in range_desc:
-        return f"{raw_value} (= {raw_value + 1} voices)"
+    An exact name match is returned on its own; otherwise every fuzzy
+    name match is returned. Cached because scripted writes resolve the
+    same handful of names over and over.
+    """
+    for hdr_name, param in _EXACT_PARAMS.get(query, ()):
+        if hdr_name == header_name:
+            return (param,)
+    matches_query = _fuzzy_matcher(query)
+    return tuple(p for p in ALL_HEADERS[header_name].parameters
+                 if matches_query(p.name_lc))
 
-    # Mod source
-    if "mod source" in range_desc:
-        for src in MODULATION_SOURCES:
-            if src.value == raw_value:
-                return f"{raw_value} ({src.name})"
 
-    return str(raw_value)
+def _find_param(header_name: str, parameter_name: str) -> Parameter | str:
+    """Find a parameter by name in a header. Returns Parameter or error string."""
+    matches = _match_params(header_name, parameter_name.strip().lower())
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        names = ", ".join(m.name for m in matches)
+        return f"Ambiguous parameter '{parameter_name}'. Matches: {names}"
+    return (f"Parameter '{parameter_name}' not found in {header_name} header. "
+            f"Use list_parameters('{header_name}') to see all parameters.")
 
 
 def _get_sampler():
@@ -626,6 +761,48 @@ def _get_sampler():
     return _get_sampler_impl()
 
 
+def _invalidate_sampler():
+    """Drop the shared connection after a device error so the next call reconnects."""
+    _reset_sampler_impl()
+
+
+# Header reads are shared through s2800.connection's cache; the agent
+# reuses a read for longer than the web UI's refresh window. Partial writes
+# patch the cached bytes in place rather than forcing a re-read.
+_HEADER_CACHE_TTL = 0.5  # seconds
+
+
+def _read_program_header_cached(sampler, program_number: int) -> bytes | None:
+    """Read a program header, reusing a read from the last TTL window."""
+    return _read_header_cached(
+        ("program", program_number),
+        lambda: sampler.read_program_header(program_number),
+        _HEADER_CACHE_TTL)
+
+
+def _read_keygroup_cached(sampler, program_number: int,
+                          keygroup_number: int) -> bytes | None:
+    """Read a keygroup header, reusing a read from the last TTL window."""
+    return _read_header_cached(
+        ("keygroup", program_number, keygroup_number),
+        lambda: sampler.read_keygroup(program_number, keygroup_number),
+        _HEADER_CACHE_TTL)
+
+
+def invalidate_device_cache() -> str:
+    """Discard recently cached program and keygroup header reads.
+
+    Header reads are reused for half a second so several parameter reads
+    on the same program cost one round-trip. Call this after editing the
+    device from its front panel to force the next read to hit the device.
+
+    Returns:
+        Confirmation message.
+    """
+    _invalidate_header_cache()
+    return "Device header cache cleared."
+
+
 def read_device_programs() -> str:
     """List all programs currently on the connected S2800.
 
@@ -650,6 +827,7 @@ def read_device_programs() -> str:
             lines.append(f"  {i}: {name}")
         return "\n".join(lines)
     except Exception as e:
+        _invalidate_sampler()
         return f"Error reading programs: {e}"
 
 
@@ -677,12 +855,16 @@ def read_device_samples() -> str:
             lines.append(f"  {i}: {name}")
         return "\n".join(lines)
     except Exception as e:
+        _invalidate_sampler()
         return f"Error reading samples: {e}"
 
 
 # Total sample memory in 16-bit words. Default: 8 MB = 4,194,304 words.
 S2800_TOTAL_WORDS = 4_194_304
 
+# Sample header bytes needed by read_memory_usage (through SSRATE at 138-139)
+_MEMORY_FIELDS_SIZE = 140
+
 
 def read_memory_usage(total_words: int = S2800_TOTAL_WORDS) -> str:
     """Read sample sizes from the S2800 and report memory usage.
@@ -704,23 +886,34 @@ def read_memory_usage(total_words: int = S2800_TOTAL_WORDS) -> str:
         if not samples:
             return "No samples on device. All memory is free."
 
-        lines = []
-        used_words = 0
-        total_secs = 0.0
+        headers = _read_sample_headers_impl(sampler, range(len(samples)))
+        valid = [i for i in range(len(samples)) if headers.get(i) is not None]
 
+        # Parse SLNGTH (offset 26, 4 bytes LE) and SSRATE (offset 138,
+        # 2 bytes LE) for all samples at once. Short headers are
+        # zero-padded, matching int.from_bytes on a truncated slice.
+        fields = np.zeros((len(valid), _MEMORY_FIELDS_SIZE), dtype=np.uint8)
+        for row, i in enumerate(valid):
+            raw = headers[i][:_MEMORY_FIELDS_SIZE]
+            fields[row, :len(raw)] = np.frombuffer(raw, dtype=np.uint8)
+
+        words = np.ascontiguousarray(fields[:, 26:30]).view("<u4")[:, 0]
+        rates = np.ascontiguousarray(fields[:, 138:140]).view("<u2")[:, 0]
+        durs = np.divide(words, rates, out=np.zeros(len(valid)),
+                         where=rates > 0)
+
+        used_words = int(words.sum(dtype=np.int64))
+        total_secs = float(durs.sum())
+        parsed = dict(zip(valid, zip(words.tolist(), durs.tolist(), strict=True),
+                          strict=True))
+
+        lines = []
         for i, name in enumerate(samples):
-            raw = sampler.read_sample_header(i)
-            if raw is None:
+            if i not in parsed:
                 lines.append(f"{i:3d}  {name:12s}  --")
                 continue
-
-            words = int.from_bytes(raw[26:30], "little")
-            rate = int.from_bytes(raw[138:140], "little")
-            used_words += words
-            dur = words / rate if rate > 0 else 0.0
-            total_secs += dur
-
-            lines.append(f"{i:3d}  {name:12s}  {words:>10,}  {dur:.3f}s")
+            words_i, dur = parsed[i]
+            lines.append(f"{i:3d}  {name:12s}  {words_i:>10,}  {dur:.3f}s")
 
         pct_used = (used_words / total_words) * 100 if total_words else 0
         lines.append(
@@ -730,6 +923,7 @@ def read_memory_usage(total_words: int = S2800_TOTAL_WORDS) -> str:
 
         return "\n".join(lines)
     except Exception as e:
+        _invalidate_sampler()
         return f"Error reading memory: {e}"
 
 
@@ -750,28 +944,10 @@ def read_program_parameter(
     Returns:
         The current value with interpretation, or an error message.
     """
-    # Find the parameter in the program header spec
-    header = ALL_HEADERS["program"]
-    param = None
-    for p in header.parameters:
-        if p.name.lower() == parameter_name.strip().lower():
-            param = p
-            break
-
-    if param is None:
-        # Try fuzzy match
-        matches = []
-        for p in header.parameters:
-            if _fuzzy_match(parameter_name, p.name):
-                matches.append(p)
-        if len(matches) == 1:
-            param = matches[0]
-        elif matches:
-            names = ", ".join(m.name for m in matches)
-            return f"Ambiguous parameter '{parameter_name}'. Matches: {names}"
-        else:
-            return (f"Parameter '{parameter_name}' not found in program header. "
-                    f"Use list_parameters('program') to see all parameters.")
+    result = _find_param("program", parameter_name)
+    if isinstance(result, str):
+        return result
+    param = result
 
     try:
         sampler = _get_sampler()
@@ -779,7 +955,7 @@ def read_program_parameter(
         return f"Could not connect to S2800: {e}"
 
     try:
-        raw_header = sampler.read_program_header(program_number)
+        raw_header = _read_program_header_cached(sampler, program_number)
         if raw_header is None:
             return f"No response from device for program {program_number}."
 
@@ -794,16 +970,16 @@ def read_program_parameter(
 
         if param.size == 1:
             value = raw_bytes[0]
-            interpreted = _interpret_value(param, value)
+            interpreted = param.interpret(value)
             lines.append(f"  Current value: {interpreted}")
         elif param.name == "PRNAME" or "name" in param.name.lower():
             name = decode_akai_name(raw_bytes)
             lines.append(f"  Current value: \"{name}\"")
         elif param.size == 2:
-            value = raw_bytes[0] | (raw_bytes[1] << 8)
-            lines.append(f"  Current value: {value} (raw: 0x{raw_bytes[0]:02X} 0x{raw_bytes[1]:02X})")
+            value = int.from_bytes(raw_bytes, "little")
+            lines.append(f"  Current value: {value} (raw: {_hex_0x(raw_bytes)})")
         else:
-            hex_str = " ".join(f"0x{b:02X}" for b in raw_bytes)
+            hex_str = _hex_0x(raw_bytes)
             lines.append(f"  Current value (raw): {hex_str}")
 
         lines.append(f"  Range: {param.range_desc}")
@@ -814,6 +990,7 @@ def read_program_parameter(
         return "\n".join(lines)
 
     except Exception as e:
+        _invalidate_sampler()
         return f"Error reading from device: {e}"
 
 
@@ -835,26 +1012,10 @@ def read_keygroup_parameter(
     Returns:
         The current value with interpretation, or an error message.
     """
-    header = ALL_HEADERS["keygroup"]
-    param = None
-    for p in header.parameters:
-        if p.name.lower() == parameter_name.strip().lower():
-            param = p
-            break
-
-    if param is None:
-        matches = []
-        for p in header.parameters:
-            if _fuzzy_match(parameter_name, p.name):
-                matches.append(p)
-        if len(matches) == 1:
-            param = matches[0]
-        elif matches:
-            names = ", ".join(m.name for m in matches)
-            return f"Ambiguous parameter '{parameter_name}'. Matches: {names}"
-        else:
-            return (f"Parameter '{parameter_name}' not found in keygroup header. "
-                    f"Use list_parameters('keygroup') to see all parameters.")
+    result = _find_param("keygroup", parameter_name)
+    if isinstance(result, str):
+        return result
+    param = result
 
     try:
         sampler = _get_sampler()
@@ -862,7 +1023,8 @@ def read_keygroup_parameter(
         return f"Could not connect to S2800: {e}"
 
     try:
-        raw_header = sampler.read_keygroup(program_number, keygroup_number)
+        raw_header = _read_keygroup_cached(sampler, program_number,
+                                           keygroup_number)
         if raw_header is None:
             return (f"No response from device for program {program_number}, "
                     f"keygroup {keygroup_number}.")
@@ -880,13 +1042,13 @@ def read_keygroup_parameter(
             lines.append(f"  Current value: \"{name}\"")
         elif param.size == 1:
             value = raw_bytes[0]
-            interpreted = _interpret_value(param, value)
+            interpreted = param.interpret(value)
             lines.append(f"  Current value: {interpreted}")
         elif param.size == 2:
-            value = raw_bytes[0] | (raw_bytes[1] << 8)
-            lines.append(f"  Current value: {value} (raw: 0x{raw_bytes[0]:02X} 0x{raw_bytes[1]:02X})")
+            value = int.from_bytes(raw_bytes, "little")
+            lines.append(f"  Current value: {value} (raw: {_hex_0x(raw_bytes)})")
         else:
-            hex_str = " ".join(f"0x{b:02X}" for b in raw_bytes)
+            hex_str = _hex_0x(raw_bytes)
             lines.append(f"  Current value (raw): {hex_str}")
 
         lines.append(f"  Range: {param.range_desc}")
@@ -897,9 +1059,54 @@ def read_keygroup_parameter(
         return "\n".join(lines)
 
     except Exception as e:
+        _invalidate_sampler()
         return f"Error reading from device: {e}"
 
 
+def _field_format(param: Parameter) -> str:
+    """struct format code for a parameter: B, little-endian H, or raw bytes."""
+    if param.size == 1:
+        return "B"
+    if param.size == 2:
+        return "H"
+    return f"{param.size}s"
+
+
+def _field_struct(fields: list[tuple[int, str]]) -> struct.Struct:
+    """Build one little-endian Struct over (offset, format) fields.
+
+    fields must be sorted by offset and must not overlap; gaps between
+    them become pad bytes.
+    """
+    parts = ["<"]
+    pos = 0
+    for offset, code in fields:
+        if offset > pos:
+            parts.append(f"{offset - pos}x")
+        parts.append(code)
+        pos = offset + struct.calcsize("<" + code)
+    return struct.Struct("".join(parts))
+
+
+# Key parameters shown by read_program_summary, in display order
+_SUMMARY_PARAMS = tuple(
+    ALL_HEADERS["program"].param_named(name)
+    for name in (
+        "PRNAME", "PRGNUM", "PMCHAN", "POLYPH", "PRIORT",
+        "PLAYLO", "PLAYHI", "OUTPUT", "PANPOS", "PRLOUD",
+        "LFORAT", "LFODEP", "B_PTCH", "B_PTCHD", "KXFADE",
+        "GROUPS", "LEGATO", "B_MODE", "TRANSPOSE", "PFXCHAN",
+    )
+)
+_SUMMARY_UNPACK_ORDER = tuple(
+    p.name for p in sorted(_SUMMARY_PARAMS, key=lambda p: p.offset)
+)
+_SUMMARY_STRUCT = _field_struct([
+    (p.offset, _field_format(p))
+    for p in sorted(_SUMMARY_PARAMS, key=lambda p: p.offset)
+])
+
+
 def read_program_summary(program_number: int = 0) -> str:
     """Read key settings from a program on the connected S2800.
 
@@ -920,45 +1127,43 @@ def read_program_summary(program_number: int = 0) -> str:
         return f"Could not connect to S2800: {e}"
 
     try:
-        raw = sampler.read_program_header(program_number)
+        raw = _read_program_header_cached(sampler, program_number)
         if raw is None:
             return f"No response from device for program {program_number}."
 
-        header = ALL_HEADERS["program"]
-
         lines = [f"Program {program_number} Summary:", ""]
 
-        # Read key parameters by name
-        key_params = [
-            "PRNAME", "PRGNUM", "PMCHAN", "POLYPH", "PRIORT",
-            "PLAYLO", "PLAYHI", "OUTPUT", "PANPOS", "PRLOUD",
-            "LFORAT", "LFODEP", "B_PTCH", "B_PTCHD", "KXFADE",
-            "GROUPS", "LEGATO", "B_MODE", "TRANSPOSE", "PFXCHAN",
-        ]
+        # One unpack for a full header; field by field if it came back short
+        if len(raw) >= _SUMMARY_STRUCT.size:
+            values = dict(zip(_SUMMARY_UNPACK_ORDER,
+                              _SUMMARY_STRUCT.unpack_from(raw), strict=True))
+        else:
+            values = {
+                p.name: struct.unpack_from("<" + _field_format(p), raw, p.offset)[0]
+                for p in _SUMMARY_PARAMS
+                if p.offset + p.size <= len(raw)
+            }
+
+        for p in _SUMMARY_PARAMS:
+            value = values.get(p.name)
+            if value is None:
+                continue
+
+            if p.name == "PRNAME":
+                val_str = f"\"{decode_akai_name(value)}\""
+            elif p.size == 1:
+                val_str = p.interpret(value)
+            elif p.size == 2:
+                val_str = str(value)
+            else:
+                val_str = _hex_0x(value)
 
-        for pname in key_params:
-            for p in header.parameters:
-                if p.name == pname:
-                    if p.offset + p.size > len(raw):
-                        continue
-                    raw_bytes = raw[p.offset:p.offset + p.size]
-
-                    if pname == "PRNAME":
-                        val_str = f"\"{decode_akai_name(raw_bytes)}\""
-                    elif p.size == 1:
-                        val_str = _interpret_value(p, raw_bytes[0])
-                    elif p.size == 2:
-                        val = raw_bytes[0] | (raw_bytes[1] << 8)
-                        val_str = str(val)
-                    else:
-                        val_str = " ".join(f"0x{b:02X}" for b in raw_bytes)
-
-                    lines.append(f"  {pname:<12} = {val_str:<20} ({p.description})")
-                    break
+            lines.append(f"  {p.name:<12} = {val_str:<20} ({p.description})")
 
         return "\n".join(lines)
 
     except Exception as e:
+        _invalidate_sampler()
         return f"Error reading from device: {e}"
 
 
@@ -966,64 +1171,177 @@ def read_program_summary(program_number: int = 0) -> str:
 # Live device tools (write)
 # ---------------------------------------------------------------------------
 
-def _find_param(header_name: str, parameter_name: str) -> Parameter | str:
-    """Find a parameter by name in a header. Returns Parameter or error string."""
-    header = ALL_HEADERS[header_name]
-    query = parameter_name.strip().lower()
+def _param_value(raw_header: bytes, param: Parameter) -> int:
+    """Extract a 1- or 2-byte little-endian parameter value from a header."""
+    return int.from_bytes(raw_header[param.offset:param.offset + param.size],
+                          "little")
 
-    for p in header.parameters:
-        if p.name.lower() == query:
-            return p
 
-    matches = [p for p in header.parameters if _fuzzy_match(query, p.name)]
-    if len(matches) == 1:
-        return matches[0]
-    if matches:
-        names = ", ".join(m.name for m in matches)
-        return f"Ambiguous parameter '{parameter_name}'. Matches: {names}"
-    return (f"Parameter '{parameter_name}' not found in {header_name} header. "
-            f"Use list_parameters('{header_name}') to see all parameters.")
+def _param_bytes(param: Parameter, value: int) -> bytes:
+    """Encode a value as the parameter's 1 or 2 little-endian bytes."""
+    mask = (1 << (8 * param.size)) - 1
+    return (value & mask).to_bytes(param.size, "little")
+
 
+def _check_write(param: Parameter, value, tool_name: str) -> str | None:
+    """Validate a parameter write before anything is sent.
 
-def _write_raw_bytes(sampler, opcode: int, program_number: int,
-                     selector: int, offset: int, data: bytes) -> str | None:
-    """Write raw bytes to a header via S3K partial write. Returns error or None."""
-    return _write_raw_bytes_impl(sampler, opcode, program_number, selector,
-                                 offset, data)
+    Rejects device-managed parameters, parameters wider than 2 bytes, and
+    values that are not integers (bools included) or do not fit the
+    parameter. Signed parameters accept either the signed value or its
+    raw unsigned form, e.g. -10 or 246.
+
+    Returns:
+        Error message, or None if the write may proceed.
+    """
+    notes = param.notes.lower()
+    if "read-only" in notes or "internal" in notes:
+        return (f"Parameter {param.name} is {param.notes}. "
+                f"Writing to it may be ignored by the device.")
+    if param.size > 2:
+        return (f"Parameter {param.name} is {param.size} bytes. "
+                f"Use {tool_name} only for 1-2 byte parameters.")
+    if isinstance(value, bool) or not isinstance(value, int):
+        return f"Value for {param.name} must be an integer, got {value!r}."
+    bits = 8 * param.size
+    low = -(1 << (bits - 1)) if param.signed else 0
+    high = (1 << bits) - 1
+    if not low <= value <= high:
+        return (f"Value {value} is out of range for {param.name} "
+                f"({low} to {high}).")
+    return None
+
+
+def _sent_value(param: Parameter, value: int) -> int:
+    """Raw header value a write of value leaves, as _param_value reads it."""
+    return int.from_bytes(_param_bytes(param, value), "little")
+
+
+def _write_params(sampler, opcode: int, program_number: int, selector: int,
+                  writes: list[tuple[Parameter, int]]) -> list[str | None]:
+    """Send partial writes back-to-back, with no header reads in between.
+
+    Writes to adjacent offsets are coalesced into a single partial write,
+    so e.g. PANPOS (24) and PRLOUD (25) cost one round-trip.
+
+    Returns one error string (or None on success) per (param, value) pair,
+    in input order. Pairs sent in the same coalesced write share its result.
+    """
+    # (start offset, data, indices into writes) per contiguous span
+    runs: list[tuple[int, bytearray, list[int]]] = []
+    for i in sorted(range(len(writes)), key=lambda i: writes[i][0].offset):
+        param, value = writes[i]
+        data = _param_bytes(param, value)
+        if runs and runs[-1][0] + len(runs[-1][1]) == param.offset:
+            runs[-1][1].extend(data)
+            runs[-1][2].append(i)
+        else:
+            runs.append((param.offset, bytearray(data), [i]))
+
+    # Each run's bytearray is handed over as-is: the write only reads it
+    # (nibble_encode copies) and the cache splice builds new bytes.
+    errors: list[str | None] = [None] * len(writes)
+    for offset, data, members in runs:
+        err = _write_raw_bytes(sampler, opcode, program_number, selector,
+                               offset, data)
+        for i in members:
+            errors[i] = err
+    return errors
+
+
+def _write_param_impl(sampler, header_name: str, program_number: int,
+                      selector: int, param: Parameter, value: int,
+                      *, verify: bool = False) -> str:
+    """Write one program or keygroup parameter and report the result.
+
+    Shared body of write_program_parameter and write_keygroup_parameter.
+    selector is the keygroup number (0 for the program header). The
+    before value may come from the header cache. Once the device replies
+    OK, the after value is the value sent, unless verify asks for a
+    confirming read from the device. Without that reply the header is
+    always read back.
+    """
+    if header_name == "program":
+        opcode = FUNC_S3K_PDATA
+        read_before = functools.partial(_read_program_header_cached, sampler,
+                                        program_number)
+        read = functools.partial(sampler.read_program_header, program_number)
+        title = f"Program {program_number}"
+        where = f"program {program_number}"
+        no_response = f"No response from device for program {program_number}."
+    else:
+        opcode = FUNC_S3K_KDATA
+        read_before = functools.partial(_read_keygroup_cached, sampler,
+                                        program_number, selector)
+        read = functools.partial(sampler.read_keygroup, program_number,
+                                 selector)
+        title = f"Program {program_number} / Keygroup {selector}"
+        where = f"program {program_number} / keygroup {selector}"
+        no_response = (f"No response from device for program {program_number}, "
+                       f"keygroup {selector}.")
+
+    # Read current value first
+    raw_header = read_before()
+    if raw_header is None:
+        return no_response
+    old_val = _param_value(raw_header, param)
+
+    [err] = _write_params(sampler, opcode, program_number, selector,
+                          [(param, value)])
+    if err and err != WRITE_UNCONFIRMED:
+        return f"Write failed for {param.name}: {err}"
+
+    if verify or err:
+        # Read back to confirm
+        new_header = read()
+        if not new_header:
+            reason = ("no reply from device; write unconfirmed" if err
+                      else "could not read back to confirm")
+            return f"Wrote {param.name} = {value} on {where} ({reason})."
+        new_val = _param_value(new_header, param)
+    else:
+        new_val = _sent_value(param, value)
+
+    old_str = param.interpret(old_val)
+    new_str = param.interpret(new_val)
+    return "\n".join((
+        f"{title}, {param.name}:",
+        f"  Before: {old_str}",
+        f"  After:  {new_str}",
+        f"  ({param.description})",
+    ))
 
 
 def write_program_parameter(
     parameter_name: str,
     value: int,
     program_number: int = 0,
+    verify: bool = False,
 ) -> str:
     """Write a value to a program parameter on the connected S2800.
 
-    Looks up the parameter in the spec, validates it, writes the value
-    via S3K partial write (opcode 0x28), then reads it back to confirm.
+    Looks up the parameter in the spec, validates it, and writes the value
+    via S3K partial write (opcode 0x28), reporting before/after values.
 
     Args:
         parameter_name: Parameter name (e.g. "POLYPH", "LEGATO", "PANPOS").
-        value: Value to write (integer, 0-255 for single-byte parameters).
+        value: Value to write (integer, 0-255 for single-byte parameters;
+            signed parameters also take -128 and up).
         program_number: Program index (0-based, default 0).
+        verify: Read the header back after the write to confirm the new
+            value (default False: the accepted value is reported as sent).
 
     Returns:
         Confirmation with before/after values, or an error message.
     """
-    from s2800.protocol import FUNC_S3K_PDATA
-
     result = _find_param("program", parameter_name)
     if isinstance(result, str):
         return result
     param = result
 
-    if "read-only" in param.notes.lower() or "internal" in param.notes.lower():
-        return (f"Parameter {param.name} is {param.notes}. "
-                f"Writing to it may be ignored by the device.")
-
-    if param.size > 2:
-        return (f"Parameter {param.name} is {param.size} bytes. "
-                f"Use write_program_parameter only for 1-2 byte parameters.")
+    err = _check_write(param, value, "write_program_parameter")
+    if err:
+        return err
 
     try:
         sampler = _get_sampler()
@@ -1031,41 +1349,96 @@ def write_program_parameter(
         return f"Could not connect to S2800: {e}"
 
     try:
-        # Read current value first
-        raw_header = sampler.read_program_header(program_number)
-        if raw_header is None:
-            return f"No response from device for program {program_number}."
+        return _write_param_impl(sampler, "program", program_number, 0x00,
+                                 param, value, verify=verify)
+    except Exception as e:
+        _invalidate_sampler()
+        return f"Error writing to device: {e}"
 
-        old_bytes = raw_header[param.offset:param.offset + param.size]
-        old_val = old_bytes[0] if param.size == 1 else (old_bytes[0] | (old_bytes[1] << 8))
 
-        # Write new value
-        if param.size == 1:
-            data = bytes([value & 0xFF])
-        else:
-            data = bytes([value & 0xFF, (value >> 8) & 0xFF])
+def write_program_parameters(
+    parameters_json: str,
+    program_number: int = 0,
+    verify: bool = False,
+) -> str:
+    """Write several program parameters on the connected S2800 in one batch.
+
+    Resolves and validates every parameter first, then sends the partial
+    writes back-to-back without reading the header between them. With
+    verify, the header is read once before and once after the batch.
 
-        err = _write_raw_bytes(sampler, FUNC_S3K_PDATA, program_number,
-                               0x00, param.offset, data)
+    Args:
+        parameters_json: JSON object mapping parameter names to values,
+            e.g. '{"POLYPH": 15, "PANPOS": -10, "PRLOUD": 90}'.
+        program_number: Program index (0-based, default 0).
+        verify: Read the header before and after to report before/after
+            values (default False).
+
+    Returns:
+        One line per parameter written, or an error message.
+    """
+    try:
+        requested = json.loads(parameters_json)
+    except Exception as e:
+        return f"Invalid parameters_json: {e}"
+    if not isinstance(requested, dict) or not requested:
+        return "parameters_json must be a non-empty JSON object of name: value."
+
+    writes = []
+    for parameter_name, value in requested.items():
+        result = _find_param("program", parameter_name)
+        if isinstance(result, str):
+            return result
+        param = result
+        err = _check_write(param, value, "write_program_parameters")
         if err:
-            return f"Write failed for {param.name}: {err}"
+            return err
+        writes.append((param, value))
 
-        # Read back to confirm
-        new_header = sampler.read_program_header(program_number)
-        if new_header:
-            new_bytes = new_header[param.offset:param.offset + param.size]
-            new_val = new_bytes[0] if param.size == 1 else (new_bytes[0] | (new_bytes[1] << 8))
-            old_str = _interpret_value(param, old_val)
-            new_str = _interpret_value(param, new_val)
-            return (f"Program {program_number}, {param.name}:\n"
-                    f"  Before: {old_str}\n"
-                    f"  After:  {new_str}\n"
-                    f"  ({param.description})")
-        else:
-            return (f"Wrote {param.name} = {value} on program {program_number} "
-                    f"(could not read back to confirm).")
+    try:
+        sampler = _get_sampler()
+    except Exception as e:
+        return f"Could not connect to S2800: {e}"
+
+    try:
+        old_header = new_header = None
+        if verify:
+            old_header = _read_program_header_cached(sampler, program_number)
+            if old_header is None:
+                return f"No response from device for program {program_number}."
+
+        errors = _write_params(sampler, FUNC_S3K_PDATA, program_number, 0x00,
+                               writes)
+        unconfirmed = WRITE_UNCONFIRMED in errors
+
+        if verify or unconfirmed:
+            new_header = sampler.read_program_header(program_number)
+
+        lines = [f"Program {program_number}: wrote {len(writes)} parameter(s)"]
+        for (param, value), err in zip(writes, errors, strict=True):
+            if err and err != WRITE_UNCONFIRMED:
+                lines.append(f"  {param.name}: write failed: {err}")
+            elif err and not new_header:
+                sent = param.interpret(_sent_value(param, value))
+                lines.append(f"  {param.name} = {sent} (unconfirmed: "
+                             f"no reply from device)")
+            elif new_header and (verify or err):
+                new_str = param.interpret(_param_value(new_header, param))
+                if old_header:
+                    old_str = param.interpret(_param_value(old_header, param))
+                    lines.append(f"  {param.name}: {old_str} -> {new_str}")
+                else:
+                    lines.append(f"  {param.name}: read back {new_str} "
+                                 f"(no reply to write)")
+            else:
+                sent = param.interpret(_sent_value(param, value))
+                lines.append(f"  {param.name} = {sent}")
+        if verify and not new_header:
+            lines.append("  (could not read back to confirm)")
+        return "\n".join(lines)
 
     except Exception as e:
+        _invalidate_sampler()
         return f"Error writing to device: {e}"
 
 
@@ -1074,35 +1447,33 @@ def write_keygroup_parameter(
     value: int,
     program_number: int = 0,
     keygroup_number: int = 0,
+    verify: bool = False,
 ) -> str:
     """Write a value to a keygroup parameter on the connected S2800.
 
-    Looks up the parameter in the spec, validates it, writes the value
-    via S3K partial write (opcode 0x2A), then reads it back to confirm.
+    Looks up the parameter in the spec, validates it, and writes the value
+    via S3K partial write (opcode 0x2A), reporting before/after values.
 
     Args:
         parameter_name: Parameter name (e.g. "kgmute", "FILFRQ", "LONOTE").
-        value: Value to write (integer, 0-255 for single-byte parameters).
+        value: Value to write (integer, 0-255 for single-byte parameters;
+            signed parameters also take -128 and up).
         program_number: Program index (0-based, default 0).
         keygroup_number: Keygroup index (0-based, default 0).
+        verify: Read the header back after the write to confirm the new
+            value (default False: the accepted value is reported as sent).
 
     Returns:
         Confirmation with before/after values, or an error message.
     """
-    from s2800.protocol import FUNC_S3K_KDATA
-
     result = _find_param("keygroup", parameter_name)
     if isinstance(result, str):
         return result
     param = result
 
-    if "internal" in param.notes.lower():
-        return (f"Parameter {param.name} is {param.notes}. "
-                f"Writing to it may be ignored by the device.")
-
-    if param.size > 2:
-        return (f"Parameter {param.name} is {param.size} bytes. "
-                f"Use write_keygroup_parameter only for 1-2 byte parameters.")
+    err = _check_write(param, value, "write_keygroup_parameter")
+    if err:
+        return err
 
     try:
         sampler = _get_sampler()
@@ -1110,42 +1481,10 @@ def write_keygroup_parameter(
         return f"Could not connect to S2800: {e}"
 
     try:
-        # Read current value first
-        raw_header = sampler.read_keygroup(program_number, keygroup_number)
-        if raw_header is None:
-            return (f"No response from device for program {program_number}, "
-                    f"keygroup {keygroup_number}.")
-
-        old_bytes = raw_header[param.offset:param.offset + param.size]
-        old_val = old_bytes[0] if param.size == 1 else (old_bytes[0] | (old_bytes[1] << 8))
-
-        # Write new value
-        if param.size == 1:
-            data = bytes([value & 0xFF])
-        else:
-            data = bytes([value & 0xFF, (value >> 8) & 0xFF])
-
-        err = _write_raw_bytes(sampler, FUNC_S3K_KDATA, program_number,
-                               keygroup_number, param.offset, data)
-        if err:
-            return f"Write failed for {param.name}: {err}"
-
-        # Read back to confirm
-        new_header = sampler.read_keygroup(program_number, keygroup_number)
-        if new_header:
-            new_bytes = new_header[param.offset:param.offset + param.size]
-            new_val = new_bytes[0] if param.size == 1 else (new_bytes[0] | (new_bytes[1] << 8))
-            old_str = _interpret_value(param, old_val)
-            new_str = _interpret_value(param, new_val)
-            return (f"Program {program_number} / Keygroup {keygroup_number}, {param.name}:\n"
-                    f"  Before: {old_str}\n"
-                    f"  After:  {new_str}\n"
-                    f"  ({param.description})")
-        else:
-            return (f"Wrote {param.name} = {value} on program {program_number} / "
-                    f"keygroup {keygroup_number} (could not read back to confirm).")
-
+        return _write_param_impl(sampler, "keygroup", program_number,
+                                 keygroup_number, param, value, verify=verify)
     except Exception as e:
+        _invalidate_sampler()
         return f"Error writing to device: {e}"
 
 
@@ -1158,6 +1497,23 @@ def _signed_byte(raw: int) -> int:
     return raw - 256 if raw > 127 else raw
 
 
+# Longest create_program waits for the new program to appear in the list
+_CREATE_POLL_TIMEOUT = 1.5  # seconds
+
+
+def _wav_data_span(buf) -> tuple[int, int]:
+    """Find the (start, length) of the data chunk in a RIFF/WAVE buffer."""
+    pos = 12
+    while pos + 8 <= len(buf):
+        chunk_id = buf[pos:pos + 4]
+        size = int.from_bytes(buf[pos + 4:pos + 8], "little")
+        if chunk_id == b"data":
+            start = pos + 8
+            return start, min(size, len(buf) - start)
+        pos += 8 + size + (size & 1)  # chunks are word-aligned
+    raise ValueError("WAV file has no data chunk")
+
+
 def create_program(
     name: str,
     keygroups_json: str,
@@ -1185,9 +1541,6 @@ def create_program(
         Status string with slot used and list of programs after creation,
         or an error message.
     """
-    import json
-    import time
-
     try:
         keygroups = json.loads(keygroups_json)
     except Exception as e:
@@ -1213,13 +1566,26 @@ def create_program(
             for kg in keygroups
         ]
 
+        # The device stores names padded and in its own charset, so compare
+        # against what the name looks like after a round trip.
+        stored_name = decode_akai_name(encode_akai_name(name))
+        _invalidate_header_cache(slot)
         sampler.create_program(name, kg_list,
                                midi_channel=midi_channel,
                                program_number=slot)
-        time.sleep(1.0)
-
-        programs = sampler.list_programs()
-        if name in programs:
+        # Poll until the new program is listed rather than waiting a fixed
+        # second; the device usually has it within tens of milliseconds.
+        deadline = time.monotonic() + _CREATE_POLL_TIMEOUT
+        delay = 0.01
+        while True:
+            programs = sampler.list_programs()
+            created = len(programs) > slot and programs[slot] == stored_name
+            if created or time.monotonic() >= deadline:
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
+        if created:
             return (f"Created program \"{name}\" at slot {slot} "
                     f"with {len(keygroups)} keygroups.\n"
                     f"Programs on device: {programs}")
@@ -1229,9 +1595,17 @@ def create_program(
                     f"Current programs: {programs}")
 
     except Exception as e:
+        _invalidate_sampler()
         return f"Error creating program: {e}"
 
 
+# Program fields saved to a preset: name, PRGNUM, PMCHAN, PANPOS (signed),
+# PRLOUD, GROUPS
+_PRESET_PROGRAM_STRUCT = _field_struct([
+    (3, "12s"), (15, "B"), (16, "B"), (24, "b"), (25, "B"), (42, "B"),
+])
+
+
 def save_preset(directory: str, program_number: int = 0) -> str:
     """Save a program from the connected S2800 to a preset JSON file.
 
@@ -1256,17 +1630,16 @@ def save_preset(directory: str, program_number: int = 0) -> str:
             return f"No response from device for program {program_number}."
 
         # Program-level fields
-        name = decode_akai_name(raw[3:15])
-        prgnum = raw[15]
-        midi_channel = raw[16]
-        panpos = _signed_byte(raw[24])
-        prloud = raw[25]
-        num_keygroups = raw[42]
-
-        # Read each keygroup
+        (name_bytes, prgnum, midi_channel, panpos, prloud,
+         num_keygroups) = _PRESET_PROGRAM_STRUCT.unpack_from(raw)
+        name = decode_akai_name(name_bytes)
+
+        # Request every keygroup up front, then walk the replies in order
+        kg_headers = _read_keygroups_impl(sampler, program_number,
+                                          range(num_keygroups))
         keygroups = []
         for kg_idx in range(num_keygroups):
-            kg_raw = sampler.read_keygroup(program_number, kg_idx)
+            kg_raw = kg_headers.get(kg_idx)
             if kg_raw is None:
                 return (f"Failed to read keygroup {kg_idx} from "
                         f"program {program_number}.")
@@ -1311,6 +1684,7 @@ def save_preset(directory: str, program_number: int = 0) -> str:
                 f"create samples/ directory with the files.")
 
     except Exception as e:
+        _invalidate_sampler()
         return f"Error saving preset: {e}"
 
 
@@ -1329,9 +1703,6 @@ def load_preset(directory: str, slot: int | None = None) -> str:
     Returns:
         Step-by-step status of the restore operation.
     """
-    import wave
-    from s2800.protocol import FUNC_S3K_PDATA, FUNC_S3K_KDATA
-
     preset_dir = Path(directory)
     preset_path = preset_dir / "preset.json"
 
@@ -1356,17 +1727,19 @@ def load_preset(directory: str, slot: int | None = None) -> str:
 
     # Step 1: Upload missing samples
     existing_samples = sampler.list_samples()
-    existing_names = [s.strip() for s in existing_samples]
+    existing_names = {s.strip() for s in existing_samples}
+    next_sample = len(existing_samples)
     samples_dir = preset_dir / "samples"
 
     for kg in keygroups:
         sample_file = kg.get("sample", "")
         sample_name = kg.get("sample_name", "")
+        wanted = sample_name.strip()
 
         if not sample_file or not sample_name:
             continue
 
-        if sample_name.strip() in existing_names:
+        if wanted in existing_names:
             steps.append(f"  Skip \"{sample_name}\" (already on device)")
             continue
 
@@ -1380,10 +1753,19 @@ def load_preset(directory: str, slot: int | None = None) -> str:
                 steps.append(f"  WARNING: {sample_file} is not mono, skipping")
                 continue
             sample_rate = wf.getframerate()
-            pcm_data = wf.readframes(wf.getnframes())
-
-        idx = sampler.upload_sample(pcm_data, sample_rate, sample_name)
-        existing_names.append(sample_name.strip())
+            frame_size = wf.getsampwidth()
+
+        # Upload straight from the mapped data chunk rather than a
+        # readframes() copy of the whole sample
+        with open(wav_path, "rb") as wav_file, \
+                mmap.mmap(wav_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, length = _wav_data_span(mm)
+            length -= length % frame_size
+            with memoryview(mm)[start:start + length] as pcm_data:
+                idx = sampler.upload_sample(pcm_data, sample_rate, sample_name,
+                                            sample_number=next_sample)
+        next_sample += 1
+        existing_names.add(wanted)
         steps.append(f"  Uploaded \"{sample_name}\" (sample {idx})")
 
     # Step 2: Determine program slot
@@ -1403,6 +1785,7 @@ def load_preset(directory: str, slot: int | None = None) -> str:
         for kg in keygroups
     ]
 
+    _invalidate_header_cache(prog_slot)
     sampler.create_program(
         name, kg_defs,
         midi_channel=midi_channel,
@@ -1412,71 +1795,36 @@ def load_preset(directory: str, slot: int | None = None) -> str:
                  f"({len(kg_defs)} keygroups)")
 
     # Step 4: Set program-level params
-    err = _write_raw_bytes(
-        sampler, FUNC_S3K_PDATA, prog_slot,
-        0x00, 15, bytes([program_number & 0xFF]),
-    )
-    if err:
-        steps.append(f"  WARNING: PRGNUM write failed: {err}")
-    else:
-        steps.append(f"  Set PRGNUM = {program_number}")
-
-    err = _write_raw_bytes(
-        sampler, FUNC_S3K_PDATA, prog_slot,
-        0x00, 24, bytes([pan & 0xFF]),
-    )
-    if err:
-        steps.append(f"  WARNING: PANPOS write failed: {err}")
-    else:
-        steps.append(f"  Set PANPOS = {pan}")
-
-    err = _write_raw_bytes(
-        sampler, FUNC_S3K_PDATA, prog_slot,
-        0x00, 25, bytes([loudness & 0xFF]),
-    )
-    if err:
-        steps.append(f"  WARNING: PRLOUD write failed: {err}")
-    else:
-        steps.append(f"  Set PRLOUD = {loudness}")
+    program_param = ALL_HEADERS["program"].param_named
+    writes = [
+        (program_param("PRGNUM"), program_number),
+        (program_param("PANPOS"), pan),
+        (program_param("PRLOUD"), loudness),
+    ]
+    errors = _write_params(sampler, FUNC_S3K_PDATA, prog_slot, 0x00, writes)
+    for (param, value), err in zip(writes, errors, strict=True):
+        if err:
+            steps.append(f"  WARNING: {param.name} write failed: {err}")
+        else:
+            steps.append(f"  Set {param.name} = {value}")
 
     # Step 5: Set per-keygroup params
+    keygroup_param = ALL_HEADERS["keygroup"].param_named
     for kg_idx, kg in enumerate(keygroups):
-        kg_results = []
-
-        # VPANO1 at offset 52
-        vpan = kg.get("pan", 0)
-        err = _write_raw_bytes(
-            sampler, FUNC_S3K_KDATA, prog_slot,
-            kg_idx, 52, bytes([vpan & 0xFF]),
-        )
-        kg_results.append(f"VPANO1={'OK' if not err else err}")
-
-        # ZPLAY1 at offset 53
-        playback = kg.get("playback", 0)
-        err = _write_raw_bytes(
-            sampler, FUNC_S3K_KDATA, prog_slot,
-            kg_idx, 53, bytes([playback & 0xFF]),
-        )
-        kg_results.append(f"ZPLAY1={'OK' if not err else err}")
-
-        # CP1 at offset 132
-        cp = 1 if kg.get("constant_pitch", False) else 0
-        err = _write_raw_bytes(
-            sampler, FUNC_S3K_KDATA, prog_slot,
-            kg_idx, 132, bytes([cp]),
-        )
-        kg_results.append(f"CP1={'OK' if not err else err}")
-
-        # KGMUTE at offset 160
         mute = kg.get("mute_group")
-        mute_val = 0xFF if mute is None else (mute & 0xFF)
-        err = _write_raw_bytes(
-            sampler, FUNC_S3K_KDATA, prog_slot,
-            kg_idx, 160, bytes([mute_val]),
+        writes = [
+            (keygroup_param("VPANO1"), kg.get("pan", 0)),
+            (keygroup_param("ZPLAY1"), kg.get("playback", 0)),
+            (keygroup_param("CP1"), 1 if kg.get("constant_pitch", False) else 0),
+            (keygroup_param("kgmute"), 0xFF if mute is None else mute),
+        ]
+        errors = _write_params(sampler, FUNC_S3K_KDATA, prog_slot, kg_idx,
+                               writes)
+        kg_results = ", ".join(
+            f"{param.name.upper()}={'OK' if not err else err}"
+            for (param, _), err in zip(writes, errors, strict=True)
         )
-        kg_results.append(f"KGMUTE={'OK' if not err else err}")
-
-        steps.append(f"  KG {kg_idx}: {', '.join(kg_results)}")
+        steps.append(f"  KG {kg_idx}: {kg_results}")
 
     result = [f"Loaded preset \"{name}\" to slot {prog_slot}:"]
     result.extend(steps)
@@ -6,10 +6,22 @@ It has no dependency on the agent layer and returns structured data, not
 formatted text strings.
 """
 
+import functools
 import logging
+import struct
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 
+from s2800.protocol import (
+    FUNC_REPLY,
+    FUNC_S3K_KDATA,
+    FUNC_S3K_PDATA,
+    REPLY_OK,
+    nibble_encode,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,31 +34,38 @@ class SamplerConnection:
 
     Connects on first use and keeps the connection open for subsequent
     calls within the same process. Reconnects automatically if the
-    connection is lost.
+    connection is lost. Connecting and closing are serialized by a lock,
+    but request/reply exchanges and the header cache are not, so device
+    I/O through the connection must come from one thread at a time.
     """
 
     def __init__(self):
         self._sampler = None
+        self._lock = threading.Lock()
 
     def get(self):
         """Get the shared S2800 connection, connecting if needed."""
         from s2800.sampler import S2800
 
-        if self._sampler is not None:
-            try:
-                if self._sampler._port_in and self._sampler._port_out:
+        with self._lock:
+            if self._sampler is not None:
+                if self._sampler.is_open():
                     return self._sampler
-            except Exception:
-                pass
-            self.close()
+                self._close()
 
-        self._sampler = S2800()
-        self._sampler.open()
-        logger.info("Connected to S2800 (persistent connection)")
-        return self._sampler
+            sampler = S2800()
+            sampler.open()
+            self._sampler = sampler
+            logger.info("Connected to S2800 (persistent connection)")
+            return sampler
 
     def close(self):
         """Explicitly close the connection."""
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        """Close the connection; caller holds the lock."""
         if self._sampler is not None:
             try:
                 self._sampler.close()
@@ -63,14 +82,41 @@ def get_sampler():
     return _default_connection.get()
 
 
+def reset_sampler():
+    """Close the shared connection so the next get_sampler() reconnects."""
+    invalidate_header_cache()
+    _default_connection.close()
+
+
 # ---------------------------------------------------------------------------
 # Low-level SysEx write
 # ---------------------------------------------------------------------------
 
+# S3K partial-write request: program, selector, offset, and byte count,
+# each multi-byte value split into 7-bit LSB/MSB
+_WRITE_REQUEST = struct.Struct("7B")
+
+# time.monotonic() of the last write_raw_bytes() send, for min_gap pacing
+_last_write_time = 0.0
+
+# Returned by write_raw_bytes() when the device sent no OK reply: the write
+# may or may not have landed, so callers should read back before reporting
+WRITE_UNCONFIRMED = "No reply from device; write unconfirmed"
+
+
 def write_raw_bytes(sampler, opcode: int, program_number: int,
-                    selector: int, offset: int, data: bytes) -> str | None:
+                    selector: int, offset: int, data: bytes,
+                    min_gap: float = 0.0) -> str | None:
     """Write raw bytes to a header via S3K partial write.
 
+    Completion is signalled by the device's reply, so writes are not
+    padded with a fixed delay. Pass min_gap to enforce a minimum spacing
+    between consecutive writes if a device needs settling time.
+
+    Once the device replies OK the bytes are spliced into any cached copy
+    of the header (see read_header_cached()), so the next read needs no
+    round-trip. Without that reply the cached copy is dropped instead.
+
     Args:
         sampler: Connected S2800 instance.
         opcode: S3K write opcode (e.g. FUNC_S3K_KDATA = 0x2A).
@@ -78,40 +124,267 @@ def write_raw_bytes(sampler, opcode: int, program_number: int,
         selector: Keygroup index (0 for program header writes).
         offset: Byte offset within the header.
         data: Raw bytes to write (nibble-encoded internally).
+        min_gap: Minimum seconds since the previous write before sending.
 
     Returns:
-        None on success, error string on failure.
+        None once the device replies OK, WRITE_UNCONFIRMED if it sent no
+        reply, or an error string if it rejected the write.
     """
-    from s2800.protocol import FUNC_REPLY, REPLY_OK
-    from s2800.protocol import nibble_encode
-
-    nibbled = nibble_encode(data)
-    payload = bytearray([
-        program_number & 0x7F,
-        (program_number >> 7) & 0x7F,
+    size = len(data)
+    payload = _WRITE_REQUEST.pack(
+        program_number & 0x7F, (program_number >> 7) & 0x7F,
         selector & 0x7F,
-        offset & 0x7F,
-        (offset >> 7) & 0x7F,
-        len(data) & 0x7F,
-        (len(data) >> 7) & 0x7F,
-    ])
-    payload.extend(nibbled)
-    sampler._send(opcode, bytes(payload))
+        offset & 0x7F, (offset >> 7) & 0x7F,
+        size & 0x7F, (size >> 7) & 0x7F,
+    ) + nibble_encode(data)
+
+    if opcode == FUNC_S3K_PDATA:
+        key = ("program", program_number)
+    elif opcode == FUNC_S3K_KDATA:
+        key = ("keygroup", program_number, selector)
+    else:
+        key = None
+        _header_cache.clear()
+    # Taken out first so a failed or interrupted write leaves no stale copy
+    hit = _header_cache.pop(key, None)
+
+    global _last_write_time
+    if min_gap > 0:
+        wait = _last_write_time + min_gap - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+    sampler._send(opcode, payload)
+    _last_write_time = time.monotonic()
 
     result = sampler._recv(timeout=3.0)
-    time.sleep(0.1)
-
-    if result and result[0] == FUNC_REPLY:
-        code = result[1][0] if result[1] else 0
-        if code != REPLY_OK:
-            return f"Device rejected write (error code {code})"
+    if not result or result[0] != FUNC_REPLY:
+        return WRITE_UNCONFIRMED
+    code = result[1][0] if result[1] else 0
+    if code != REPLY_OK:
+        return f"Device rejected write (error code {code})"
+
+    if hit is not None:
+        read_time, raw = hit
+        end = offset + len(data)
+        if end <= len(raw):
+            _header_cache[key] = (read_time,
+                                  b"".join((raw[:offset], data, raw[end:])))
     return None
 
 
+# ---------------------------------------------------------------------------
+# Pipelined header reads
+# ---------------------------------------------------------------------------
+
+def _collect(sampler, pending: set, parse, headers: dict, timeout: float,
+             until=None, order=()):
+    """Store replies for pending keys in headers, matched by echoed key.
+
+    timeout is an idle timeout: it restarts whenever a pending reply
+    arrives, so a long batch that is still streaming in is not cut off.
+    Replies for keys no longer pending (late duplicates) are discarded.
+    Returns once every key has arrived, once until has arrived if given,
+    or after timeout seconds without a pending reply.
+
+    An error reply (e.g. for a missing program or keygroup) echoes no key.
+    It settles until if given; otherwise it settles the first pending key
+    in order after the last one answered, since the device answers
+    requests in the order they were sent. A settled key is stored as None
+    and is not re-requested.
+    """
+    position = {key: i for i, key in enumerate(order)}
+    last = -1
+    deadline = time.monotonic() + timeout
+    while pending and (until is None or until in pending):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        result = sampler._recv(timeout=remaining)
+        if result is None:
+            return
+        if result[0] == FUNC_REPLY:
+            code = result[1][0] if result[1] else REPLY_OK
+            if code == REPLY_OK:
+                continue
+            if until is not None:
+                key = until
+            else:
+                later = [k for k in order if k in pending and position[k] > last]
+                key = later[0] if later else None
+            if key is None:
+                continue
+            raw = None
+        else:
+            parsed = parse(*result)
+            if parsed is None:
+                continue
+            key, raw = parsed
+        if key in pending:
+            headers[key] = raw
+            pending.discard(key)
+            last = max(last, position.get(key, last))
+            deadline = time.monotonic() + timeout
+
+
+def _read_pipelined(sampler, keys, request, parse, timeout: float) -> dict:
+    """Send every request, then collect replies matched by their echoed key.
+
+    Args:
+        sampler: Connected S2800 instance.
+        keys: Keys identifying each header to read.
+        request: request(key) sends the request for one key.
+        parse: parse(function, payload) returns (key, raw) or None.
+        timeout: Seconds to wait for the next reply before giving up.
+
+    Returns:
+        Dict mapping key → raw header bytes (None if unread or refused).
+    """
+    keys = list(keys)
+    headers = {}
+
+    sampler._drain()
+    for key in keys:
+        request(key)
+
+    pending = set(keys)
+    _collect(sampler, pending, parse, headers, timeout, order=keys)
+
+    # Re-request anything dropped in the pipelined pass, one at a time.
+    # Replies are still matched by key: late replies from the first pass
+    # may be queued ahead of the one asked for.
+    for key in keys:
+        if key in pending:
+            request(key)
+            _collect(sampler, pending, parse, headers, timeout, until=key)
+
+    for key in pending:
+        headers[key] = None
+    return headers
+
+
+def read_sample_headers(sampler, indices,
+                        timeout: float = 5.0) -> dict[int, bytes | None]:
+    """Read several sample headers with back-to-back requests.
+
+    Sends every sample header request before waiting, then collects the
+    replies keyed by the sample index echoed in each response. The wall
+    time is roughly one round-trip plus transfer time instead of one
+    round-trip per sample. Headers the device did not answer in the
+    pipelined pass are re-requested one at a time.
+
+    Args:
+        sampler: Connected S2800 instance.
+        indices: Sample indices to read.
+        timeout: Seconds to wait for each next reply.
+
+    Returns:
+        Dict mapping sample index → raw header bytes (None if unread).
+    """
+    return _read_pipelined(sampler, indices, sampler.request_sample_header,
+                           sampler.parse_sample_header, timeout)
+
+
+def read_keygroups(sampler, program_number: int, keygroup_numbers,
+                   timeout: float = 5.0) -> dict[int, bytes | None]:
+    """Read several keygroup headers of one program with back-to-back requests.
+
+    Same pipelining as read_sample_headers(), matching each reply by the
+    program and keygroup numbers it echoes.
+
+    Args:
+        sampler: Connected S2800 instance.
+        program_number: Program index.
+        keygroup_numbers: Keygroup indices to read.
+        timeout: Seconds to wait for each next reply.
+
+    Returns:
+        Dict mapping keygroup index → raw header bytes (None if unread).
+    """
+    def parse(function, payload):
+        parsed = sampler.parse_keygroup(function, payload)
+        if parsed is None or parsed[0] != program_number:
+            return None
+        return parsed[1], parsed[2]
+
+    return _read_pipelined(
+        sampler, keygroup_numbers,
+        lambda kg: sampler.request_keygroup(program_number, kg),
+        parse,
+        timeout,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Header cache
+# ---------------------------------------------------------------------------
+
+# Recently read headers: key -> (time.monotonic() of read, raw bytes), keyed
+# ("program", program) or ("keygroup", program, keygroup). Shared by the
+# agent tools and read_kg_fields() so a burst of reads on one header costs
+# a single SysEx round-trip. write_raw_bytes() patches entries in place.
+# Not locked: like the device I/O that fills it, use from one thread.
+_header_cache: dict[tuple, tuple[float, bytes]] = {}
+
+
+def read_header_cached(key: tuple, read: Callable[[], bytes | None],
+                       ttl: float) -> bytes | None:
+    """Return the cached header for key, or call read() and cache the result.
+
+    Args:
+        key: Cache key, ("program", program) or
+            ("keygroup", program, keygroup).
+        read: Zero-argument callable that reads the header from the device.
+        ttl: Maximum age in seconds of a cached header (0 = always read).
+
+    Returns:
+        Raw header bytes, or None if the read failed.
+    """
+    now = time.monotonic()
+    hit = _header_cache.get(key)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    raw = read()
+    if raw is None:
+        _header_cache.pop(key, None)
+    else:
+        _header_cache[key] = (now, raw)
+    return raw
+
+
+def invalidate_header_cache(program_number: int | None = None) -> None:
+    """Drop cached headers for one program (and its keygroups), or all."""
+    if program_number is None:
+        _header_cache.clear()
+        return
+    for key in [k for k in _header_cache if k[1] == program_number]:
+        del _header_cache[key]
+
+
 # ---------------------------------------------------------------------------
 # Batch keygroup state read
 # ---------------------------------------------------------------------------
 
+def get_keygroup_raw(program: int, kg_index: int,
+                     ttl: float = 0.05) -> bytes | None:
+    """Read a raw keygroup header, reusing a read from the last ttl seconds.
+
+    Lets several read_kg_fields() calls within one UI refresh share a
+    single SysEx round-trip. Goes through read_header_cached(), so writes
+    made with write_raw_bytes() are reflected without a re-read.
+
+    Args:
+        program: Program index.
+        kg_index: Keygroup index.
+        ttl: Maximum age in seconds of a cached header (0 = always read).
+
+    Returns:
+        Raw keygroup header bytes, or None if the read failed.
+    """
+    return read_header_cached(
+        ("keygroup", program, kg_index),
+        lambda: get_sampler().read_keygroup(program, kg_index), ttl)
+
+
 @dataclass
 class KgField:
     """Descriptor for a single parameter within a keygroup header."""
@@ -121,11 +394,39 @@ class KgField:
     signed: bool = False
 
 
-def read_kg_fields(program: int, kg_index: int,
-                   fields: list[KgField]) -> dict[str, int] | None:
+# KgField (size, signed) -> struct format code
+_KG_FIELD_CODES = {(1, False): "B", (1, True): "b", (2, False): "H", (2, True): "h"}
+
+
+@functools.lru_cache(maxsize=64)
+def _kg_fields_struct(layout: tuple[tuple[int, int, bool], ...]):
+    """Compile (offset, size, signed) field layouts into one Struct.
+
+    Returns (Struct, order), where order[i] is the position in layout of
+    the i-th unpacked value, or None if fields overlap or have a size
+    struct cannot express.
+    """
+    order = sorted(range(len(layout)), key=lambda i: layout[i][0])
+    fmt = ["<"]
+    pos = 0
+    for i in order:
+        offset, size, signed = layout[i]
+        code = _KG_FIELD_CODES.get((size, signed))
+        if code is None or offset < pos:
+            return None
+        if offset > pos:
+            fmt.append(f"{offset - pos}x")
+        fmt.append(code)
+        pos = offset + size
+    return struct.Struct("".join(fmt)), tuple(order)
+
+
+def read_kg_fields(program: int, kg_index: int, fields: list[KgField],
+                   ttl: float = 0.05) -> dict[str, int] | None:
     """Read multiple keygroup header fields in one SysEx round-trip.
 
-    Calls sampler.read_keygroup() once and extracts all requested fields
+    Reads the keygroup header once (via get_keygroup_raw(), so calls
+    within ttl seconds share it) and extracts all requested fields
     from the raw bytes. Much more efficient than reading each parameter
     individually for state-loading use cases.
 
@@ -133,30 +434,28 @@ def read_kg_fields(program: int, kg_index: int,
         program: Program index.
         kg_index: Keygroup index.
         fields: List of KgField descriptors.
+        ttl: Maximum age in seconds of a cached header (0 = always read).
 
     Returns:
         Dict mapping field name → integer value, or None if read failed.
     """
-    sampler = get_sampler()
-    raw = sampler.read_keygroup(program, kg_index)
+    raw = get_keygroup_raw(program, kg_index, ttl)
     if raw is None:
         return None
 
-    result = {}
-    for f in fields:
-        b = raw[f.offset:f.offset + f.size]
-        if f.size == 1:
-            val = b[0]
-        else:
-            val = b[0] | (b[1] << 8)
-        if f.signed:
-            if f.size == 1 and val > 127:
-                val -= 256
-            elif f.size == 2 and val > 32767:
-                val -= 65536
-        result[f.name] = val
+    compiled = _kg_fields_struct(
+        tuple((f.offset, f.size, f.signed) for f in fields))
+    if compiled is not None and compiled[0].size <= len(raw):
+        unpacker, order = compiled
+        values = unpacker.unpack_from(raw)
+        return {fields[i].name: v for i, v in zip(order, values, strict=True)}
 
-    return result
+    view = memoryview(raw)  # slice fields without copying
+    return {
+        f.name: int.from_bytes(view[f.offset:f.offset + f.size], "little",
+                               signed=f.signed)
+        for f in fields
+    }
 
 
 def write_kg_field(program: int, kg_index: int,
@@ -172,8 +471,6 @@ def write_kg_field(program: int, kg_index: int,
     Returns:
         Tuple (old_value, new_value) on success, or error string on failure.
     """
-    from s2800.protocol import FUNC_S3K_KDATA
-
     sampler = get_sampler()
 
     # Read current value
@@ -183,18 +480,17 @@ def write_kg_field(program: int, kg_index: int,
     old_val = current[field.name]
 
     # Encode and write
-    if field.size == 1:
-        data = bytes([value & 0xFF])
-    else:
-        data = bytes([value & 0xFF, (value >> 8) & 0xFF])
+    data = (value & ((1 << 8 * field.size) - 1)).to_bytes(field.size, "little")
 
     err = write_raw_bytes(sampler, FUNC_S3K_KDATA, program, kg_index,
                           field.offset, data)
-    if err:
+    if err and err != WRITE_UNCONFIRMED:
         return err
 
-    # Read back
-    confirmed = read_kg_fields(program, kg_index, [field])
+    # Read back from the device, not the cached copy the write patched
+    confirmed = read_kg_fields(program, kg_index, [field], ttl=0)
     if confirmed is None:
-        return old_val, value  # Could not confirm, assume success
+        if err:
+            return err
+        return old_val, value  # Device replied OK, assume success
     return old_val, confirmed[field.name]
@@ -8,8 +8,14 @@ Field offsets based on the S2800/S3000 SysEx specification:
 https://lakai.sourceforge.net/docs/s2800_sysex.html
 """
 
+import struct
+
 from s2800.protocol import encode_akai_name
 
+# Little-endian multi-byte fields, packed in place
+_U16 = struct.Struct("<H")
+_SAMPLE_EXTENT = struct.Struct("<III")  # data length, play start, play end
+
 
 def build_sample_header(name: str, sample_length: int,
                         sample_rate: int = 44100,
@@ -52,25 +58,14 @@ def build_sample_header(name: str, sample_length: int,
     header[0x11] = 0     # First active loop index
     header[0x13] = 0     # Playback type: no loop
 
-    # Data length at 0x1A (4 bytes LE)
-    header[0x1A] = sample_length & 0xFF
-    header[0x1B] = (sample_length >> 8) & 0xFF
-    header[0x1C] = (sample_length >> 16) & 0xFF
-    header[0x1D] = (sample_length >> 24) & 0xFF
-
-    # Play start at 0x1E (0)
-    # (already zero from bytearray init)
-
-    # Play end at 0x22 (sample_length - 1)
+    # Data length at 0x1A, play start at 0x1E (0), play end at 0x22
+    # (sample_length - 1), each 4 bytes LE
     play_end = max(0, sample_length - 1)
-    header[0x22] = play_end & 0xFF
-    header[0x23] = (play_end >> 8) & 0xFF
-    header[0x24] = (play_end >> 16) & 0xFF
-    header[0x25] = (play_end >> 24) & 0xFF
+    _SAMPLE_EXTENT.pack_into(header, 0x1A, sample_length & 0xFFFFFFFF,
+                             0, play_end & 0xFFFFFFFF)
 
     # Sample rate at 0x8A (2 bytes LE)
-    header[0x8A] = sample_rate & 0xFF
-    header[0x8B] = (sample_rate >> 8) & 0xFF
+    _U16.pack_into(header, 0x8A, sample_rate & 0xFFFF)
 
     return bytes(header)
 
@@ -197,8 +192,7 @@ def build_keygroup(low_note: int, high_note: int, sample_name: str,
     # Tuning offset at offsets 5-6 (KGTUNO, 2 bytes)
     # Format: cents * 100 + semitones, as signed 16-bit
     tune_val = tune_cents + (tune_semitones * 100)
-    header[0x05] = tune_val & 0xFF
-    header[0x06] = (tune_val >> 8) & 0xFF
+    _U16.pack_into(header, 0x05, tune_val & 0xFFFF)
 
     # Filter frequency at offset 7 (99 = fully open)
     header[0x07] = 99
@@ -6,6 +6,10 @@ SysEx message construction. No I/O, no state.
 Message format: F0 47 [channel] [function] 48 [data...] F7
 """
 
+import functools
+
+import numpy as np
+
 # Akai manufacturer ID and S1000 family model ID
 AKAI_MFR = 0x47
 S1000_MODEL = 0x48
@@ -57,9 +61,17 @@ def akai_to_ascii(code: int) -> str:
     return "?"
 
 
+# ASCII byte -> Akai character code, for encoding whole names with translate
+_ASCII_TO_AKAI = bytes(ascii_to_akai(chr(code)) if code < 128 else 10
+                       for code in range(256))
+
+
+@functools.lru_cache(maxsize=1024)
 def encode_akai_name(name: str, length: int = 12) -> bytes:
     """Encode a string as an Akai name, padded with spaces.
 
+    Results are cached: kit uploads encode the same few names repeatedly.
+
     Args:
         name: ASCII name (max `length` chars)
         length: Target length (default 12)
@@ -67,18 +79,47 @@ def encode_akai_name(name: str, length: int = 12) -> bytes:
     Returns:
         Encoded bytes of exactly `length` bytes
     """
-    result = bytearray()
-    for i in range(length):
-        if i < len(name):
-            result.append(ascii_to_akai(name[i]))
-        else:
-            result.append(10)  # space padding
-    return bytes(result)
+    # Non-ASCII characters become "?", which maps to space like any
+    # other character outside the Akai set
+    encoded = name[:length].encode("ascii", "replace").translate(_ASCII_TO_AKAI)
+    return encoded.ljust(length, b"\x0a")  # space padding
+
+
+# Akai character code -> ASCII byte, for decoding whole names with translate
+_AKAI_TO_ASCII = bytes(ord(akai_to_ascii(code)) for code in range(256))
 
 
 def decode_akai_name(data: bytes) -> str:
     """Decode Akai-encoded name bytes to ASCII, stripping trailing spaces."""
-    return "".join(akai_to_ascii(b) for b in data).rstrip()
+    return bytes(data).translate(_AKAI_TO_ASCII).decode("ascii").rstrip()
+
+
+def decode_akai_names(data: bytes, count: int, length: int = 12) -> list[str]:
+    """Decode consecutive fixed-length Akai names with one translate.
+
+    Args:
+        data: Packed name bytes
+        count: Number of names expected; names not fully present in
+            data are dropped
+        length: Bytes per name (default 12)
+
+    Returns:
+        List of decoded names, trailing spaces stripped
+    """
+    size = min(count, len(data) // length) * length
+    text = bytes(data[:size]).translate(_AKAI_TO_ASCII).decode("ascii")
+    return [text[i:i + length].rstrip() for i in range(0, size, length)]
+
+
+# Per-byte lookup tables for nibble_encode/nibble_decode. Mapping whole
+# buffers through bytes.translate keeps the per-byte work in C.
+_LO_NIBBLE = bytes(b & 0x0F for b in range(256))
+_HI_NIBBLE = bytes(b >> 4 for b in range(256))
+_LO_NIBBLE_TO_HI = bytes((b & 0x0F) << 4 for b in range(256))
+
+# Raw byte count from which the numpy codec beats the translate tables;
+# below it numpy's per-call overhead dominates (headers are ~200 bytes)
+_NUMPY_NIBBLE_MIN = 1024
 
 
 def nibble_encode(data: bytes) -> bytes:
@@ -93,10 +134,16 @@ def nibble_encode(data: bytes) -> bytes:
     Returns:
         Nibble-encoded bytes (2x input length)
     """
-    result = bytearray()
-    for b in data:
-        result.append(b & 0x0F)
-        result.append((b >> 4) & 0x0F)
+    if len(data) >= _NUMPY_NIBBLE_MIN:
+        raw = np.frombuffer(data, dtype=np.uint8)
+        out = np.empty(2 * raw.size, dtype=np.uint8)
+        out[0::2] = raw & 0x0F
+        out[1::2] = raw >> 4
+        return out.tobytes()
+    data = bytes(data)
+    result = bytearray(2 * len(data))
+    result[0::2] = data.translate(_LO_NIBBLE)
+    result[1::2] = data.translate(_HI_NIBBLE)
     return bytes(result)
 
 
@@ -109,12 +156,16 @@ def nibble_decode(data: bytes) -> bytes:
     Returns:
         Raw bytes (half the input length)
     """
-    result = bytearray()
-    for i in range(0, len(data) - 1, 2):
-        lo = data[i] & 0x0F
-        hi = data[i + 1] & 0x0F
-        result.append(lo | (hi << 4))
-    return bytes(result)
+    count = len(data) // 2
+    if count >= _NUMPY_NIBBLE_MIN:
+        pairs = np.frombuffer(data, dtype=np.uint8)[:2 * count]
+        return ((pairs[0::2] & 0x0F) | ((pairs[1::2] & 0x0F) << 4)).tobytes()
+    data = bytes(data)
+    lo = data[0:2 * count:2].translate(_LO_NIBBLE)
+    hi = data[1:2 * count:2].translate(_LO_NIBBLE_TO_HI)
+    # lo holds only low nibbles and hi only high nibbles, so OR-ing the
+    # two as big integers combines every byte pair without carries
+    return (int.from_bytes(lo, "big") | int.from_bytes(hi, "big")).to_bytes(count, "big")
 
 
 def build_message(channel: int, function: int, data: bytes = b"") -> bytes:
@@ -9,6 +9,7 @@ import platform
 import time
 
 import mido
+import numpy as np
 
 if platform.system() == "Darwin":
     mido.set_backend("mido.backends.rtmidi/MACOSX_CORE")
@@ -24,21 +25,22 @@ from s2800.protocol import (
     FUNC_DELP,
     FUNC_S3K_PDATA, FUNC_S3K_KDATA,
     FUNC_S3K_RPDATA, FUNC_S3K_RKDATA,
+    FUNC_S3K_RSDATA, FUNC_WRITE_SAMPLE_HDR,
     FUNC_DELS,
     FUNC_REPLY,
     REPLY_OK,
     build_message,
     nibble_encode, nibble_decode,
-    decode_akai_name,
+    decode_akai_names, encode_akai_name,
 )
 from s2800.headers import build_sample_header, build_program_header, build_keygroup
-from midi.ports import find_ports
+from midi.ports import QueuedInput, find_ports, receive_message
 from midi.sds import (
     pack_16bit_to_sds,
     build_data_packet,
     parse_handshake, wait_for_handshake,
     SDS_ACK, SDS_NAK, SDS_CANCEL, SDS_WAIT,
-    SDS_PACKET_DATA_BYTES,
+    SDS_PACKET_BYTES, SDS_PACKET_DATA_BYTES,
     SDS_HANDSHAKE_TIMEOUT, SDS_PACKET_TIMEOUT,
     SDS_MAX_RETRIES,
 )
@@ -99,7 +101,7 @@ class S2800:
         self._port_in_name = in_name
         self._port_out_name = out_name
         self._port_out = mido.open_output(out_name)
-        self._port_in = mido.open_input(in_name)
+        self._port_in = QueuedInput(in_name)
 
     def close(self):
         """Close MIDI ports."""
@@ -110,6 +112,12 @@ class S2800:
             self._port_out.close()
             self._port_out = None
 
+    def is_open(self) -> bool:
+        """True if both MIDI ports are open and not closed underneath us."""
+        port_in, port_out = self._port_in, self._port_out
+        return (port_in is not None and port_out is not None
+                and not port_in.closed and not port_out.closed)
+
     def __enter__(self):
         self.open()
         return self
@@ -121,8 +129,15 @@ class S2800:
 
     def _send(self, function: int, data: bytes = b""):
         """Send an S1000-family SysEx message."""
-        msg = build_message(self._channel, function, data)
-        self._port_out.send(mido.Message('sysex', data=list(msg[1:-1])))
+        self._send_raw(build_message(self._channel, function, data))
+
+    def _send_raw(self, msg: bytes | bytearray):
+        """Send a complete SysEx message (F0 ... F7) as-is.
+
+        The message data is copied into the mido.Message, so callers may
+        reuse msg afterwards.
+        """
+        self._port_out.send(mido.Message('sysex', data=msg[1:-1]))
 
     def _recv(self, timeout: float = 5.0) -> tuple[int, bytes] | None:
         """Wait for an S1000-family SysEx reply.
@@ -130,16 +145,17 @@ class S2800:
         Returns:
             Tuple of (function_code, payload) or None on timeout.
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            for m in self._port_in.iter_pending():
-                if m.type == 'sysex' and len(m.data) >= 4:
-                    data = list(m.data)
-                    if data[0] == AKAI_MFR and data[3] == S1000_MODEL:
-                        function = data[2]
-                        payload = bytes(data[4:])
-                        return function, payload
-            time.sleep(0.01)
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while remaining > 0:
+            m = receive_message(self._port_in, remaining)
+            if m is None:
+                return None
+            if m.type == 'sysex' and len(m.data) >= 4:
+                data = bytes(m.data)
+                if data[0] == AKAI_MFR and data[3] == S1000_MODEL:
+                    return data[2], data[4:]
+            remaining = deadline - time.monotonic()
         return None
 
     def _drain(self):
@@ -147,6 +163,25 @@ class S2800:
         for _ in self._port_in.iter_pending():
             pass
 
+    def _list_names(self, request: int, response: int) -> list[str]:
+        """Request a name list (RSLIST/RPLIST) and decode the reply.
+
+        Reply payload: 2-byte count, then 12-byte Akai names.
+        """
+        self._drain()
+        self._send(request)
+
+        result = self._recv(timeout=5.0)
+        if result is None:
+            return []
+
+        function, payload = result
+        if function != response or len(payload) < 2:
+            return []
+
+        count = int.from_bytes(payload[0:2], "little")
+        return decode_akai_names(memoryview(payload)[2:], count)
+
     def _wait_for_sdata_response(self, timeout: float = SDS_HANDSHAKE_TIMEOUT):
         """Wait for SDATA response: WAIT+ACK, direct ACK, or REPLY error.
 
@@ -156,38 +191,40 @@ class S2800:
         Raises:
             S2800Error: On rejection, error, or timeout.
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            for m in self._port_in.iter_pending():
-                if m.type != 'sysex':
-                    continue
-
-                raw = bytes([0xF0] + list(m.data) + [0xF7])
-                data = list(m.data)
-
-                # Check for SDS handshake
-                hs = parse_handshake(raw)
-                if hs:
-                    if hs["type"] == SDS_ACK:
-                        return True
-                    if hs["type"] == SDS_WAIT:
-                        # Wait for follow-up ACK
-                        hs2 = wait_for_handshake(self._port_in, timeout=SDS_HANDSHAKE_TIMEOUT)
-                        if hs2 and hs2["type"] == SDS_ACK:
-                            return True
-                        raise S2800Error("No ACK after WAIT")
-                    if hs["type"] in (SDS_NAK, SDS_CANCEL):
-                        raise S2800Error(f"Device rejected: {hs['type_name']}")
-
-                # Check for Akai REPLY error
-                if data[0] == AKAI_MFR and len(data) >= 5:
-                    if data[2] == FUNC_REPLY and data[3] == S1000_MODEL:
-                        code = data[4] if len(data) > 4 else 0
-                        if code != REPLY_OK:
-                            raise S2800Error(f"Device error (code={code})")
-                        return True
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while remaining > 0:
+            m = receive_message(self._port_in, remaining)
+            if m is None:
+                break
+            remaining = deadline - time.monotonic()
+            if m.type != 'sysex':
+                continue
+
+            data = bytes(m.data)
+            raw = b"\xf0" + data + b"\xf7"
 
-            time.sleep(0.01)
+            # Check for SDS handshake
+            hs = parse_handshake(raw)
+            if hs:
+                if hs["type"] == SDS_ACK:
+                    return True
+                if hs["type"] == SDS_WAIT:
+                    # Wait for follow-up ACK
+                    hs2 = wait_for_handshake(self._port_in, timeout=SDS_HANDSHAKE_TIMEOUT)
+                    if hs2 and hs2["type"] == SDS_ACK:
+                        return True
+                    raise S2800Error("No ACK after WAIT")
+                if hs["type"] in (SDS_NAK, SDS_CANCEL):
+                    raise S2800Error(f"Device rejected: {hs['type_name']}")
+
+            # Check for Akai REPLY error
+            if data[0] == AKAI_MFR and len(data) >= 5:
+                if data[2] == FUNC_REPLY and data[3] == S1000_MODEL:
+                    code = data[4] if len(data) > 4 else 0
+                    if code != REPLY_OK:
+                        raise S2800Error(f"Device error (code={code})")
+                    return True
 
         raise S2800Error("Timeout waiting for SDATA response")
 
@@ -199,62 +236,40 @@ class S2800:
         Returns:
             List of sample names decoded to ASCII.
         """
-        self._drain()
-        self._send(FUNC_RSLIST)
-
-        result = self._recv(timeout=5.0)
-        if result is None:
-            return []
-
-        function, payload = result
-        if function != FUNC_SLIST:
-            return []
-        if len(payload) < 2:
-            return []
-
-        count = payload[0] | (payload[1] << 8)
-        names = []
-        offset = 2
-        for _ in range(count):
-            if offset + 12 > len(payload):
-                break
-            name_bytes = payload[offset:offset + 12]
-            names.append(decode_akai_name(name_bytes))
-            offset += 12
-        return names
+        return self._list_names(FUNC_RSLIST, FUNC_SLIST)
 
     def upload_sample(self, pcm_data: bytes, sample_rate: int, name: str,
-                      original_pitch: int = 60, progress=None) -> int:
+                      original_pitch: int = 60, progress=None,
+                      sample_number: int | None = None) -> int:
         """Upload a single sample to the device.
 
         Flow:
-            1. list_samples() to get current count
+            1. list_samples() to get current count (skipped if
+               sample_number is given)
             2. SDATA with 192-byte header (nibble-encoded)
             3. Wait for WAIT+ACK
             4. Send SDS data packets with per-packet handshaking
             5. Return new sample index
 
         Args:
-            pcm_data: 16-bit signed PCM bytes (little-endian, mono).
-                      Will be converted to unsigned offset binary.
+            pcm_data: 16-bit signed PCM bytes or any buffer over them, such
+                      as a memoryview of a mapped WAV (little-endian, mono).
+                      Converted to unsigned offset binary one packet at a
+                      time, so the whole sample is never copied.
             sample_rate: Sample rate in Hz
             name: Sample name (max 12 chars)
             original_pitch: MIDI note number for the sample's natural pitch (default 60=C3)
             progress: Optional callback(packets_sent, total_packets)
+            sample_number: Index for the new sample, normally the current
+                sample count. Batch uploads pass it to save one list_samples()
+                round-trip per sample; None queries the device.
 
         Returns:
             Index of the newly created sample
         """
-        import numpy as np
-
-        # Convert signed PCM to unsigned offset binary (S2800 format)
-        samples = np.frombuffer(pcm_data, dtype=np.int16).copy()
-        samples = (samples.astype(np.int32) + 32768).astype(np.uint16).view(np.int16)
-        unsigned_pcm = samples.tobytes()
-
-        sample_count = len(pcm_data) // 2
-        existing = self.list_samples()
-        sample_number = len(existing)
+        sample_count = memoryview(pcm_data).nbytes // 2
+        if sample_number is None:
+            sample_number = len(self.list_samples())
 
         # Build and send SDATA with 192-byte header
         header = build_sample_header(
@@ -275,41 +290,63 @@ class S2800:
         # Wait for device acknowledgment
         self._wait_for_sdata_response()
 
-        # Send SDS data packets
-        sds_data = pack_16bit_to_sds(unsigned_pcm)
-        total_packets = (len(sds_data) + SDS_PACKET_DATA_BYTES - 1) // SDS_PACKET_DATA_BYTES
+        # Send SDS data packets. Each packet carries a fixed number of
+        # samples (3 SDS bytes apiece), so packets are converted and packed
+        # straight from the PCM buffer as they are needed.
+        per_packet = SDS_PACKET_DATA_BYTES // 3
+        total_packets = (sample_count + per_packet - 1) // per_packet
+
+        # Released on the way out, even on error, so a caller's mapped
+        # file can be closed
+        with memoryview(pcm_data).cast("B") as pcm_view:
+            def fill(pkt_num: int, into: bytearray):
+                start = pkt_num * per_packet
+                end = min(start + per_packet, sample_count)
+                # Convert signed PCM to unsigned offset binary (S2800 format)
+                # (adding 32768 mod 2^16 is just flipping the sign bit)
+                samples = np.frombuffer(pcm_view[2 * start:2 * end],
+                                        dtype=np.uint16) ^ 0x8000
+                build_data_packet(pkt_num % 128,
+                                  pack_16bit_to_sds(samples.tobytes()),
+                                  channel=0x00, into=into)
+
+            # Double-buffered: packet N+1 is built into the spare buffer while
+            # the device handshakes packet N, which stays intact for NAK resends
+            packet = bytearray(SDS_PACKET_BYTES)
+            spare = bytearray(SDS_PACKET_BYTES)
+            if total_packets:
+                fill(0, packet)
+
+            for pkt_num in range(total_packets):
+                retries = 0
+                while True:
+                    self._send_raw(packet)
+                    if retries == 0 and pkt_num + 1 < total_packets:
+                        fill(pkt_num + 1, spare)
+
+                    hs = wait_for_handshake(self._port_in, timeout=SDS_PACKET_TIMEOUT)
+                    if hs is None:
+                        raise S2800Error(f"Timeout at packet {pkt_num}")
 
-        for pkt_num in range(total_packets):
-            offset = pkt_num * SDS_PACKET_DATA_BYTES
-            chunk = sds_data[offset:offset + SDS_PACKET_DATA_BYTES]
-
-            retries = 0
-            while True:
-                packet = build_data_packet(pkt_num % 128, chunk, channel=0x00)
-                self._port_out.send(mido.Message('sysex', data=list(packet[1:-1])))
-
-                hs = wait_for_handshake(self._port_in, timeout=SDS_PACKET_TIMEOUT)
-                if hs is None:
-                    raise S2800Error(f"Timeout at packet {pkt_num}")
-
-                if hs["type"] == SDS_ACK:
-                    break
-                elif hs["type"] == SDS_WAIT:
-                    time.sleep(0.5)
-                    hs2 = wait_for_handshake(self._port_in, timeout=SDS_HANDSHAKE_TIMEOUT)
-                    if hs2 and hs2["type"] == SDS_ACK:
+                    if hs["type"] == SDS_ACK:
                         break
-                    raise S2800Error(f"No ACK after WAIT at packet {pkt_num}")
-                elif hs["type"] == SDS_NAK:
-                    retries += 1
-                    if retries >= SDS_MAX_RETRIES:
-                        raise S2800Error(f"Max retries at packet {pkt_num}")
-                    continue
-                elif hs["type"] == SDS_CANCEL:
-                    raise S2800Error(f"Device cancelled at packet {pkt_num}")
-
-            if progress:
-                progress(pkt_num + 1, total_packets)
+                    elif hs["type"] == SDS_WAIT:
+                        # WAIT means the device will ACK when ready
+                        hs2 = wait_for_handshake(self._port_in, timeout=SDS_HANDSHAKE_TIMEOUT)
+                        if hs2 and hs2["type"] == SDS_ACK:
+                            break
+                        raise S2800Error(f"No ACK after WAIT at packet {pkt_num}")
+                    elif hs["type"] == SDS_NAK:
+                        retries += 1
+                        if retries >= SDS_MAX_RETRIES:
+                            raise S2800Error(f"Max retries at packet {pkt_num}")
+                        continue
+                    elif hs["type"] == SDS_CANCEL:
+                        raise S2800Error(f"Device cancelled at packet {pkt_num}")
+
+                packet, spare = spare, packet
+                if progress:
+                    progress(pkt_num + 1, total_packets)
 
         return sample_number
 
@@ -319,16 +356,12 @@ class S2800:
         Args:
             index: Sample index (0-based)
         """
-        data = bytes([index & 0x7F, (index >> 7) & 0x7F])
-        self._send(FUNC_DELS, data)
+        self._send_delete(FUNC_DELS, index)
         time.sleep(0.3)
 
     def delete_all_samples(self):
         """Delete all samples by iterating in reverse order."""
-        names = self.list_samples()
-        for i in range(len(names) - 1, -1, -1):
-            self.delete_sample(i)
-            time.sleep(0.2)
+        self._delete_all(FUNC_DELS, len(self.list_samples()))
 
     # --- Programs ---
 
@@ -340,29 +373,7 @@ class S2800:
         Returns:
             List of program names decoded to ASCII.
         """
-        self._drain()
-        self._send(FUNC_RPLIST)
-
-        result = self._recv(timeout=5.0)
-        if result is None:
-            return []
-
-        function, payload = result
-        if function != FUNC_PLIST:
-            return []
-        if len(payload) < 2:
-            return []
-
-        count = payload[0] | (payload[1] << 8)
-        names = []
-        offset = 2
-        for _ in range(count):
-            if offset + 12 > len(payload):
-                break
-            name_bytes = payload[offset:offset + 12]
-            names.append(decode_akai_name(name_bytes))
-            offset += 12
-        return names
+        return self._list_names(FUNC_RPLIST, FUNC_PLIST)
 
     def delete_program(self, index: int):
         """Delete a program by index.
@@ -370,16 +381,44 @@ class S2800:
         Args:
             index: Program index (0-based)
         """
-        data = bytes([index & 0x7F, (index >> 7) & 0x7F])
-        self._send(FUNC_DELP, data)
+        self._send_delete(FUNC_DELP, index)
         time.sleep(0.3)
 
     def delete_all_programs(self):
         """Delete all programs by iterating in reverse order."""
-        names = self.list_programs()
-        for i in range(len(names) - 1, -1, -1):
-            self.delete_program(i)
-            time.sleep(0.2)
+        self._delete_all(FUNC_DELP, len(self.list_programs()))
+
+    def _send_delete(self, function: int, index: int):
+        """Send a DELS or DELP request for one item."""
+        self._send(function, bytes([index & 0x7F, (index >> 7) & 0x7F]))
+
+    def _delete_all(self, function: int, count: int, settle: float = 0.3):
+        """Delete items count-1 .. 0 with DELP or DELS.
+
+        Paces the deletes by the device rather than a fixed 0.5 s sleep:
+        each delete waits for the device's reply, or at most settle
+        seconds when none comes.
+
+        Raises:
+            S2800Error: If the device replies with an error code
+        """
+        self._drain()
+        for i in range(count - 1, -1, -1):
+            self._send_delete(function, i)
+            deadline = time.monotonic() + settle
+            remaining = settle
+            while remaining > 0:
+                reply = self._recv(timeout=remaining)
+                if reply is None:
+                    break
+                if reply[0] == FUNC_REPLY:
+                    code = reply[1][0] if reply[1] else REPLY_OK
+                    if code != REPLY_OK:
+                        raise S2800Error(
+                            f"Device refused to delete item {i} "
+                            f"(error code {code})")
+                    break
+                remaining = deadline - time.monotonic()
 
     def create_program(self, name: str, keygroups: list[dict],
                        midi_channel: int = 0, program_number: int = 0):
@@ -411,14 +450,8 @@ class S2800:
             midi_channel=midi_channel,
             program_number=program_number,
         )
-        nibbled_hdr = nibble_encode(prog_hdr)
-
-        pdata_payload = bytearray([
-            program_number & 0x7F,
-            (program_number >> 7) & 0x7F,
-        ])
-        pdata_payload.extend(nibbled_hdr)
-        self._send(FUNC_PDATA, bytes(pdata_payload))
+        prog_index = bytes([program_number & 0x7F, (program_number >> 7) & 0x7F])
+        self._send(FUNC_PDATA, prog_index + nibble_encode(prog_hdr))
 
         result = self._recv(timeout=5.0)
         if result is not None:
@@ -432,6 +465,10 @@ class S2800:
         time.sleep(0.5)
 
         # Step 2: Send each 192-byte keygroup via KDATA (0x09)
+        # S1000 KDATA: pp PP kk [nibbled_data]; one payload buffer is
+        # reused, with only kk and the header rewritten per keygroup
+        kdata_payload = bytearray(3 + 2 * 192)
+        kdata_payload[0:2] = prog_index
         for kg_idx, kg in enumerate(keygroups):
             self._drain()
 
@@ -440,16 +477,9 @@ class S2800:
                 high_note=kg["high_note"],
                 sample_name=kg["sample_name"],
             )
-            nibbled_kg = nibble_encode(kg_hdr)
-
-            # S1000 KDATA: pp PP kk [nibbled_data]
-            kdata_payload = bytearray([
-                program_number & 0x7F,
-                (program_number >> 7) & 0x7F,
-                kg_idx & 0x7F,
-            ])
-            kdata_payload.extend(nibbled_kg)
-            self._send(FUNC_KDATA, bytes(kdata_payload))
+            kdata_payload[2] = kg_idx & 0x7F
+            kdata_payload[3:] = nibble_encode(kg_hdr)
+            self._send(FUNC_KDATA, kdata_payload)
 
             result = self._recv(timeout=5.0)
             if result is not None:
@@ -476,7 +506,6 @@ class S2800:
             name: New program name (12 chars max), or None to keep existing
             num_keygroups: New keygroup count, or None to keep existing
         """
-        from s2800.protocol import encode_akai_name
 
         # Write name at offset 3 (12 bytes)
         if name is not None:
@@ -525,7 +554,6 @@ class S2800:
             high_note: New upper key range (21-127)
             sample_name: New sample name for zone 1
         """
-        from s2800.protocol import encode_akai_name
 
         # Write LONOTE + HINOTE at offsets 3-4 (2 bytes)
         if low_note is not None or high_note is not None:
@@ -615,19 +643,19 @@ class S2800:
             return None
         return None
 
-    def read_keygroup(self, program_number: int = 0,
-                      keygroup_number: int = 0) -> bytes | None:
-        """Read back a keygroup header from the device.
+    def request_keygroup(self, program_number: int = 0,
+                         keygroup_number: int = 0):
+        """Send an S3000 keygroup header request (0x29) without waiting.
 
-        Uses S3000 extended code (0x29) with offset/count format:
+        Format:
             F0 47 cc 29 48 [pp PP] kk [oo oo] [nn nn] F7
 
+        The reply is decoded with parse_keygroup(). Used directly by
+        callers that pipeline several requests before collecting replies.
+
         Args:
             program_number: Program index (0-based)
             keygroup_number: Keygroup index (0-based)
-
-        Returns:
-            Raw (nibble-decoded) keygroup header bytes, or None on timeout.
         """
         # Request full 191-byte keygroup header
         data = bytes([
@@ -640,23 +668,140 @@ class S2800:
         ])
         self._send(FUNC_S3K_RKDATA, data)
 
-        result = self._recv(timeout=5.0)
-        if result is None:
-            return None
+    @staticmethod
+    def parse_keygroup(function: int,
+                       payload: bytes) -> tuple[int, int, bytes] | None:
+        """Decode a keygroup header reply.
 
-        function, payload = result
-        if function == FUNC_S3K_KDATA:
+        Args:
+            function: Reply function code from _recv()
+            payload: Reply payload from _recv()
+
+        Returns:
+            Tuple of (program_number, keygroup_number, raw header bytes),
+            or None if the reply is not a keygroup header.
+        """
+        if function == FUNC_S3K_KDATA and len(payload) >= 7:
             # S3000 response: [pp, PP, kk, oo_lo, oo_hi, nn_lo, nn_hi, nibbled...]
-            nibbled = payload[7:]
-            return nibble_decode(nibbled)
-        if function == FUNC_KDATA:
+            program = payload[0] | (payload[1] << 7)
+            return program, payload[2], nibble_decode(payload[7:])
+        if function == FUNC_KDATA and len(payload) >= 4:
             # S1000 fallback response: [pp, PP, kk, KK, nibbled...]
-            nibbled = payload[4:]
-            return nibble_decode(nibbled)
+            program = payload[0] | (payload[1] << 7)
+            keygroup = payload[2] | (payload[3] << 7)
+            return program, keygroup, nibble_decode(payload[4:])
         if function == FUNC_REPLY:
             code = payload[0] if len(payload) > 0 else 0
             logger.warning("RKDATA reply code=%d", code)
-            return None
+        return None
+
+    def read_keygroup(self, program_number: int = 0,
+                      keygroup_number: int = 0) -> bytes | None:
+        """Read back a keygroup header from the device.
+
+        Uses S3000 extended code (0x29) with offset/count format.
+
+        Args:
+            program_number: Program index (0-based)
+            keygroup_number: Keygroup index (0-based)
+
+        Returns:
+            Raw (nibble-decoded) keygroup header bytes, or None on timeout.
+        """
+        self.request_keygroup(program_number, keygroup_number)
+
+        # Skip stale replies (e.g. left over from a pipelined read) that
+        # echo a different program or keygroup
+        deadline = time.monotonic() + 5.0
+        remaining = 5.0
+        while remaining > 0:
+            result = self._recv(timeout=remaining)
+            if result is None:
+                return None
+            parsed = self.parse_keygroup(*result)
+            if parsed is None:
+                return None
+            if parsed[0] == program_number and parsed[1] == keygroup_number:
+                return parsed[2]
+            remaining = deadline - time.monotonic()
+        return None
+
+    def request_sample_header(self, sample_number: int = 0):
+        """Send an S3000 sample header request (0x2B) without waiting.
+
+        Format:
+            F0 47 cc 2B 48 [ss SS] 00 [oo oo] [nn nn] F7
+
+        The reply is decoded with parse_sample_header(). Used directly by
+        callers that pipeline several requests before collecting replies.
+
+        Args:
+            sample_number: Sample index (0-based)
+        """
+        # Request full 192-byte sample header
+        data = bytes([
+            sample_number & 0x7F,         # ss
+            (sample_number >> 7) & 0x7F,  # SS
+            0x00,                          # reserved
+            0x00, 0x00,                    # offset = 0
+            192 & 0x7F,                   # count low (0x40)
+            (192 >> 7) & 0x7F,            # count high (0x01)
+        ])
+        self._send(FUNC_S3K_RSDATA, data)
+
+    @staticmethod
+    def parse_sample_header(function: int,
+                            payload: bytes) -> tuple[int, bytes] | None:
+        """Decode a sample header reply.
+
+        Args:
+            function: Reply function code from _recv()
+            payload: Reply payload from _recv()
+
+        Returns:
+            Tuple of (sample_number, raw header bytes), or None if the
+            reply is not a sample header.
+        """
+        if function == FUNC_WRITE_SAMPLE_HDR and len(payload) >= 7:
+            # S3000 response: [ss, SS, 0x00, oo_lo, oo_hi, nn_lo, nn_hi, nibbled...]
+            index = payload[0] | (payload[1] << 7)
+            return index, nibble_decode(payload[7:])
+        if function == FUNC_SDATA and len(payload) >= 2:
+            # S1000 fallback response: [ss, SS, nibbled...]
+            index = payload[0] | (payload[1] << 7)
+            return index, nibble_decode(payload[2:])
+        if function == FUNC_REPLY:
+            code = payload[0] if len(payload) > 0 else 0
+            logger.warning("RSDATA reply code=%d", code)
+        return None
+
+    def read_sample_header(self, sample_number: int = 0) -> bytes | None:
+        """Read back a sample header from the device.
+
+        Uses S3000 extended code (0x2B) with offset/count format.
+
+        Args:
+            sample_number: Sample index (0-based)
+
+        Returns:
+            Raw (nibble-decoded) sample header bytes, or None on timeout.
+        """
+        self.request_sample_header(sample_number)
+
+        # Skip stale replies (e.g. left over from a pipelined read) that
+        # echo a different sample
+        deadline = time.monotonic() + 5.0
+        remaining = 5.0
+        while remaining > 0:
+            result = self._recv(timeout=remaining)
+            if result is None:
+                return None
+            parsed = self.parse_sample_header(*result)
+            if parsed is None:
+                return None
+            if parsed[0] == sample_number:
+                return parsed[1]
+            remaining = deadline - time.monotonic()
         return None
 
     # --- MIDI playback ---
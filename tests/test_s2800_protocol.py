@@ -0,0 +1,127 @@
+"""Hardware-free tests for the S2800 SysEx and SDS encoders.
+
+Checks the table- and numpy-based codecs against the straightforward
+per-byte reference implementations they replaced.
+
+Run:  pytest tests/test_s2800_protocol.py
+"""
+
+import pytest
+from midi.sds import (
+    SDS_DATA_PACKET,
+    SDS_PACKET_BYTES,
+    SDS_PACKET_DATA_BYTES,
+    SDS_SYSEX_ID,
+    build_data_packet,
+)
+from s2800.protocol import _NUMPY_NIBBLE_MIN, nibble_decode, nibble_encode
+
+# --- Reference implementations ---
+
+def _reference_nibble_encode(data: bytes) -> bytes:
+    result = bytearray()
+    for b in data:
+        result.append(b & 0x0F)
+        result.append((b >> 4) & 0x0F)
+    return bytes(result)
+
+
+def _reference_nibble_decode(data: bytes) -> bytes:
+    result = bytearray()
+    for i in range(0, len(data) - 1, 2):
+        result.append((data[i] & 0x0F) | ((data[i + 1] & 0x0F) << 4))
+    return bytes(result)
+
+
+def _reference_checksum(packet_number: int, data: bytes,
+                        channel: int = 0x00) -> int:
+    padded = bytearray(data[:SDS_PACKET_DATA_BYTES])
+    padded.extend(bytes(SDS_PACKET_DATA_BYTES - len(padded)))
+    checksum = (SDS_SYSEX_ID ^ (channel & 0x7F) ^ SDS_DATA_PACKET
+                ^ (packet_number & 0x7F))
+    for b in padded:
+        checksum ^= b
+    return checksum & 0x7F
+
+
+def _pattern(length: int) -> bytes:
+    """Every byte value, repeated to length."""
+    return bytes(i % 256 for i in range(length))
+
+
+# --- Nibble codec ---
+
+# Either side of the switch from translate tables to numpy
+NIBBLE_LENGTHS = [0, 1, _NUMPY_NIBBLE_MIN - 1, _NUMPY_NIBBLE_MIN,
+                  _NUMPY_NIBBLE_MIN + 1]
+
+
+@pytest.mark.parametrize("length", NIBBLE_LENGTHS)
+def test_nibble_encode_matches_reference(length):
+    data = _pattern(length)
+    assert nibble_encode(data) == _reference_nibble_encode(data)
+
+
+@pytest.mark.parametrize("length", NIBBLE_LENGTHS)
+def test_nibble_decode_matches_reference(length):
+    encoded = _reference_nibble_encode(_pattern(length))
+    assert nibble_decode(encoded) == _reference_nibble_decode(encoded)
+
+
+@pytest.mark.parametrize("length", NIBBLE_LENGTHS)
+def test_nibble_round_trip(length):
+    data = _pattern(length)
+    encoded = nibble_encode(data)
+    assert len(encoded) == 2 * length
+    assert nibble_decode(encoded) == data
+
+
+@pytest.mark.parametrize("length", NIBBLE_LENGTHS)
+def test_nibble_decode_ignores_high_bits_and_odd_tail(length):
+    # Devices only send low nibbles, but stray high bits must be masked
+    # and a trailing odd byte dropped, as the reference loop does
+    encoded = bytes(b | 0x70 for b in nibble_encode(_pattern(length))) + b"\x05"
+    assert nibble_decode(encoded) == _reference_nibble_decode(encoded)
+
+
+def test_nibble_codec_accepts_memoryview():
+    data = _pattern(_NUMPY_NIBBLE_MIN + 1)
+    encoded = nibble_encode(memoryview(data))
+    assert nibble_decode(memoryview(encoded)) == data
+
+
+# --- SDS data packets ---
+
+@pytest.mark.parametrize("packet_number,length,channel", [
+    (0, 0, 0x00),
+    (1, 1, 0x00),
+    (127, SDS_PACKET_DATA_BYTES, 0x05),
+    (128, SDS_PACKET_DATA_BYTES + 10, 0x7F),
+    (42, 37, 0x10),
+])
+def test_build_data_packet_checksum(packet_number, length, channel):
+    data = bytes((i * 37 + 11) & 0x7F for i in range(length))
+    msg = build_data_packet(packet_number, data, channel)
+
+    assert isinstance(msg, bytes)
+    assert len(msg) == SDS_PACKET_BYTES
+    assert msg[0] == 0xF0 and msg[-1] == 0xF7
+    assert msg[4] == packet_number & 0x7F
+    assert msg[125] == _reference_checksum(packet_number, data, channel)
+
+
+def test_build_data_packet_into_reuses_buffer():
+    buf = bytearray(b"\x7F" * SDS_PACKET_BYTES)
+    full = bytes(range(SDS_PACKET_DATA_BYTES))
+    short = b"\x01\x02\x03"
+
+    first = build_data_packet(3, full, into=buf)
+    assert first is buf
+    assert bytes(buf) == build_data_packet(3, full)
+
+    # A shorter payload must zero the rest of the previous packet
+    second = build_data_packet(4, short, into=buf)
+    assert second is buf
+    assert bytes(buf) == build_data_packet(4, short)
+    assert buf[125] == _reference_checksum(4, short)
+    assert buf[8:125] == bytes(125 - 8)